@@ -6,24 +6,59 @@ detecting quality issues, and creating improvement plans.
 """
 
 import asyncio
+import bisect
+import copy
+import gzip
+import hashlib
+import heapq
 import json
 import logging
+import pickle
 import re
+import sys
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, List, Optional, Any, Tuple, Set, FrozenSet, Iterable
 from datetime import datetime, timedelta
-from collections import defaultdict, Counter
-from dataclasses import dataclass, asdict
+from collections import defaultdict, Counter, deque, OrderedDict
+from itertools import chain
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
 import phonenumbers
 import validators
 from urllib.parse import urlparse
-import statistics
+# orjson is a declared dependency; the stdlib fallback only keeps minimal installs importable
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logger
 logger = logging.getLogger("AURA_NEXUS.ReviewAgent")
 
+# Severity levels ordered from least to most severe
+_SEVERITY_LEVELS = ('low', 'medium', 'high', 'critical')
+_SEV_RANK = {severity: rank for rank, severity in enumerate(_SEVERITY_LEVELS)}
+
+
+def _dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes with orjson (stdlib encoder only in the fallback)"""
+    if orjson:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, ensure_ascii=False, sort_keys=sort_keys, default=str).encode('utf-8')
+
+
+@lru_cache(maxsize=None)
+def _humanize(key: str) -> str:
+    """Display title for a snake_case key ('fake_data' -> 'Fake Data'); keys come from a small vocabulary"""
+    return key.replace('_', ' ').title()
+
 # ===================================================================================
 # DATA MODELS
 # ===================================================================================
@@ -40,6 +75,17 @@ class QualityIssue:
     suggestion: Optional[str] = None
     confidence: float = 1.0
     record_id: Optional[str] = None
+    
+    def __post_init__(self):
+        # Grouping keys repeated across thousands of issues; column names may arrive un-interned
+        for name in ('severity', 'category', 'field', 'issue_type'):
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the fields (all primitives, so asdict's deep copy is unnecessary)"""
+        return self.__dict__.copy()
 
 @dataclass
 class QualityMetrics:
@@ -54,8 +100,31 @@ class QualityMetrics:
     valid_records: int
     issues_by_severity: Dict[str, int]
     improvement_areas: List[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the fields; the containers are built fresh per analysis and not shared"""
+        return self.__dict__.copy()
+    
+    @classmethod
+    def from_dict(cls, metrics: Dict[str, Any], **defaults) -> 'QualityMetrics':
+        """Rebuild from a report's metrics dict; every missing field falls back to defaults, then 0/empty"""
+        values = {f.name: 0 for f in fields(cls)}
+        values.update(issues_by_severity={}, improvement_areas=[])
+        for source in (defaults, metrics):
+            values.update((name, source[name]) for name in values.keys() & source.keys())
+        return cls(**values)
 
-@dataclass
+# Title keywords that classify a recommendation, mapped to its tag
+_TITLE_TAG_KEYWORDS = (
+    ('fake data detection', 'fake_data_detection'),
+    ('fake data', 'fake_data'),
+    ('completeness', 'completeness'),
+    ('enrichment', 'enrichment'),
+    ('validation', 'validation'),
+    ('monitoring', 'monitoring')
+)
+
+@dataclass(slots=True, frozen=True)
 class ImprovementRecommendation:
     """System improvement recommendation"""
     priority: str  # 'critical', 'high', 'medium', 'low'
@@ -66,6 +135,38 @@ class ImprovementRecommendation:
     estimated_impact: str
     implementation_complexity: str
     code_changes_needed: List[str]
+    tags: Optional[FrozenSet[str]] = None  # derived from the title when not given
+    parsed_code_changes: Tuple[Tuple[str, str], ...] = field(default=(), init=False, repr=False, compare=False)
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Few distinct values, used as Counter keys and in comparisons
+        for name in ('priority', 'category', 'implementation_complexity'):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+        if self.tags is None:
+            title = self.title.lower()
+            object.__setattr__(self, 'tags', frozenset(tag for keyword, tag in _TITLE_TAG_KEYWORDS if keyword in title))
+        # (file_path, description) pairs from the 'path - description' entries
+        object.__setattr__(self, 'parsed_code_changes', tuple(
+            tuple(change.split(' - ', 1)) for change in self.code_changes_needed if ' - ' in change
+        ))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict form of the recommendation (without tags), built once and reused by later callers.
+        
+        Shallow: the lists are shared with the instance and must be treated as read-only.
+        """
+        cached = self._cached_dict
+        if cached is None:
+            cached = {name: getattr(self, name) for name in _RECOMMENDATION_DICT_FIELDS}
+            object.__setattr__(self, '_cached_dict', cached)
+        return cached
+
+
+# Serialized fields: the constructor arguments minus the internal tags
+_RECOMMENDATION_DICT_FIELDS = tuple(
+    f.name for f in fields(ImprovementRecommendation) if f.init and f.name != 'tags'
+)
 
 # ===================================================================================
 # CLASS: DataQualityAnalyzer
@@ -442,7 +543,7 @@ class DataQualityAnalyzer:
         
         # Check for duplicate business names with different data
         if 'gdr_nome' in df.columns:
-            name_groups = df.groupby('gdr_nome')
+            name_groups = df.groupby('gdr_nome', observed=True)
             for name, group in name_groups:
                 if len(group) > 1:
                     # Check if they have different contact info (possible duplicates)
@@ -497,7 +598,7 @@ class DataQualityAnalyzer:
         total_records = len(df)
         
         # Count issues by severity
-        issues_by_severity = Counter(issue.severity for issue in issues)
+        issues_by_severity = Counter(map(attrgetter('severity'), issues))
         
         # Calculate fake data percentage
         fake_issues = [issue for issue in issues if issue.category == 'fake_data']
@@ -594,20 +695,20 @@ class DataQualityAnalyzer:
     
     def _identify_improvement_areas(self, issues: List[QualityIssue]) -> List[str]:
         """Identify key areas for improvement"""
-        category_counts = Counter(issue.category for issue in issues)
-        issue_type_counts = Counter(issue.issue_type for issue in issues)
+        category_counts = Counter(map(attrgetter('category'), issues))
+        issue_type_counts = Counter(map(attrgetter('issue_type'), issues))
         
         areas = []
         
         # Top categories
         for category, count in category_counts.most_common(3):
             if count > 0:
-                areas.append(f"{category.replace('_', ' ').title()} ({count} issues)")
+                areas.append(f"{_humanize(category)} ({count} issues)")
         
         # Top specific issues
         for issue_type, count in issue_type_counts.most_common(2):
             if count > 0:
-                areas.append(f"{issue_type.replace('_', ' ').title()} ({count} cases)")
+                areas.append(f"{_humanize(issue_type)} ({count} cases)")
         
         return areas[:5]  # Limit to top 5 areas
     
@@ -665,12 +766,112 @@ class DataQualityAnalyzer:
 # CLASS: ResultReviewer
 # ===================================================================================
 
+# Fields whose fill rates are reported as enrichment success in performance analysis
+_PERFORMANCE_ENRICHMENT_FIELDS = (
+    'gdr_url_instagram', 'gdr_url_facebook', 'gdr_insta_followers',
+    'gdr_fb_followers', 'gdr_analise_reviews', 'gdr_telefone_1',
+    'gdr_email_1', 'gdr_website'
+)
+
+_CATEGORY_RECOMMENDATIONS = {
+    'fake_data': [
+        "Implement stricter data validation during collection",
+        "Add fake data detection to preprocessing pipeline",
+        "Review data sources for quality issues"
+    ],
+    'missing_data': [
+        "Improve data collection processes",
+        "Configure additional data sources",
+        "Implement data completion strategies"
+    ],
+    'invalid_format': [
+        "Add format validation to input pipeline",
+        "Standardize data formats across sources",
+        "Implement data cleaning procedures"
+    ]
+}
+
+
+def _severity_counts(issues: List[QualityIssue]) -> np.ndarray:
+    """Count issues per severity, indexed by _SEV_RANK"""
+    severity_codes = np.fromiter((_SEV_RANK[issue.severity] for issue in issues),
+                                 dtype=np.int8, count=len(issues))
+    return np.bincount(severity_codes, minlength=len(_SEVERITY_LEVELS))
+
+
+def _finding_for_category(category: str, category_issues: List[QualityIssue]) -> Dict[str, Any]:
+    """Build the detailed finding for a single issue category"""
+    severity_counts = _severity_counts(category_issues)
+    finding = {
+        'category': category,
+        'title': f"{_humanize(category)} Analysis",
+        'issue_count': len(category_issues),
+        'severity_breakdown': {_SEVERITY_LEVELS[rank]: int(count)
+                               for rank, count in enumerate(severity_counts) if count},
+        'top_issues': [],
+        'affected_fields': list(set(issue.field for issue in category_issues)),
+        'recommendations': list(_CATEGORY_RECOMMENDATIONS.get(category, []))
+    }
+    
+    # Get top issues by severity
+    sorted_issues = sorted(category_issues, 
+                         key=lambda x: _SEV_RANK[x.severity],
+                         reverse=True)
+    
+    for issue in sorted_issues[:5]:  # Top 5 issues
+        finding['top_issues'].append({
+            'severity': issue.severity,
+            'type': issue.issue_type,
+            'description': issue.description,
+            'suggestion': issue.suggestion,
+            'field': issue.field
+        })
+    
+    return finding
+
+
 class ResultReviewer:
     """Reviews and analyzes processing results comprehensively"""
     
-    def __init__(self, data_analyzer: DataQualityAnalyzer):
+    def __init__(self,
+                 data_analyzer: DataQualityAnalyzer,
+                 history_size: int = 32,
+                 persist_dir: Optional[str] = None):
         self.data_analyzer = data_analyzer
-        self.review_history = []
+        # Only the most recent reviews stay in memory; older ones are spilled to
+        # persist_dir when configured, otherwise dropped
+        self.review_history = deque(maxlen=history_size)
+        self.persist_dir = Path(persist_dir) if persist_dir else None
+        self._archived_reviews: List[Path] = []
+        
+        if self.persist_dir:
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _store_review(self, review_report: Dict[str, Any]):
+        """Append a review to the history, spilling the evicted one to disk if configured"""
+        if self.persist_dir and len(self.review_history) == self.review_history.maxlen:
+            evicted = self.review_history[0]
+            archive_path = self.persist_dir / f"review_{datetime.now():%Y%m%d_%H%M%S_%f}.pkl.gz"
+            with gzip.open(archive_path, 'wb') as f:
+                pickle.dump(evicted, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._archived_reviews.append(archive_path)
+        
+        self.review_history.append(review_report)
+    
+    def get_review(self, index: int) -> Dict[str, Any]:
+        """Get a past review by position (oldest first), reloading spilled reviews from disk"""
+        archived_count = len(self._archived_reviews)
+        total_reviews = archived_count + len(self.review_history)
+        if index < 0:
+            index += total_reviews
+        if not 0 <= index < total_reviews:
+            raise IndexError("review index out of range")
+        
+        if index >= archived_count:
+            return self.review_history[index - archived_count]
+        
+        with gzip.open(self._archived_reviews[index], 'rb') as f:
+            return pickle.load(f)
     
     async def review_processing_results(self, 
                                       results_df: pd.DataFrame,
@@ -689,6 +890,8 @@ class ResultReviewer:
         """
         logger.info("📋 Starting comprehensive result review...")
         
+        results_df = self._prepare_frame(results_df)
+        
         review_report = {
             'timestamp': datetime.now().isoformat(),
             'summary': {},
@@ -702,8 +905,8 @@ class ResultReviewer:
         # 1. Quality Analysis
         quality_metrics, quality_issues = await self.data_analyzer.analyze_data_quality(results_df)
         review_report['quality_analysis'] = {
-            'metrics': asdict(quality_metrics),
-            'issues': [asdict(issue) for issue in quality_issues]
+            'metrics': quality_metrics.to_dict(),
+            'issues': [issue.to_dict() for issue in quality_issues]
         }
         
         # 2. Performance Analysis
@@ -719,21 +922,44 @@ class ResultReviewer:
         summary = self._generate_review_summary(quality_metrics, quality_issues, performance_analysis)
         review_report['summary'] = summary
         
-        # 5. Detailed Findings
-        detailed_findings = await self._generate_detailed_findings(results_df, quality_issues)
+        # 5. Detailed Findings (clean results with only a few issues skip the breakdown)
+        if quality_metrics.overall_score >= 95 and len(quality_issues) < 10:
+            detailed_findings = []
+        else:
+            detailed_findings = await self._generate_detailed_findings(results_df, quality_issues)
         review_report['detailed_findings'] = detailed_findings
         
         # Store in history
-        self.review_history.append(review_report)
+        self._store_review(review_report)
         
         logger.info(f"✅ Review complete. Quality score: {quality_metrics.overall_score:.2f}/100")
         
         return review_report
     
+    def _prepare_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of df with low-cardinality text columns stored as categoricals"""
+        total_records = len(df)
+        if total_records == 0:
+            return df
+        
+        categorical_columns = {}
+        for col in df.select_dtypes(include=['object', 'string']).columns:
+            try:
+                if df[col].nunique() / total_records < 0.5:
+                    categorical_columns[col] = 'category'
+            except TypeError:
+                # Unhashable cells (lists, dicts) stay as they are
+                continue
+        
+        return df.astype(categorical_columns) if categorical_columns else df
+    
     async def _analyze_processing_performance(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze processing performance metrics"""
+        columns = set(df.columns)
+        total_records = len(df)
+        rate_factor = 100.0 / total_records if total_records else 0.0
         performance = {
-            'total_records_processed': len(df),
+            'total_records_processed': total_records,
             'successful_enrichments': {},
             'failed_enrichments': {},
             'processing_efficiency': {},
@@ -741,37 +967,33 @@ class ResultReviewer:
         }
         
         # Analyze enrichment success rates
-        enrichment_fields = [
-            'gdr_url_instagram', 'gdr_url_facebook', 'gdr_insta_followers',
-            'gdr_fb_followers', 'gdr_analise_reviews', 'gdr_telefone_1',
-            'gdr_email_1', 'gdr_website'
-        ]
-        
-        for field in enrichment_fields:
-            if field in df.columns:
-                filled_count = df[field].notna().sum()
-                success_rate = (filled_count / len(df)) * 100
+        present_fields = [field for field in _PERFORMANCE_ENRICHMENT_FIELDS if field in columns]
+        if present_fields:
+            # Per-column reduction keeps each block in its own dtype (no object-array copy)
+            filled_counts = df[present_fields].notna().sum()
+            for field, filled_count in filled_counts.items():
+                success_rate = filled_count * rate_factor
                 performance['successful_enrichments'][field] = {
                     'count': filled_count,
                     'rate': success_rate
                 }
         
-        # Analyze token usage and costs (if available)
-        if 'gdr_total_tokens' in df.columns:
-            total_tokens = df['gdr_total_tokens'].sum()
-            avg_tokens_per_record = df['gdr_total_tokens'].mean()
-            performance['resource_usage']['total_tokens'] = total_tokens
-            performance['resource_usage']['avg_tokens_per_record'] = avg_tokens_per_record
-        
-        if 'gdr_total_cost' in df.columns:
-            total_cost = df['gdr_total_cost'].sum()
-            avg_cost_per_record = df['gdr_total_cost'].mean()
-            performance['resource_usage']['total_cost'] = total_cost
-            performance['resource_usage']['avg_cost_per_record'] = avg_cost_per_record
+        # Analyze token usage and costs (if available), reducing both columns in one agg call
+        resource_columns = {
+            'gdr_total_tokens': ('total_tokens', 'avg_tokens_per_record'),
+            'gdr_total_cost': ('total_cost', 'avg_cost_per_record')
+        }
+        present_resources = [col for col in resource_columns if col in columns]
+        if present_resources:
+            resource_stats = df[present_resources].agg(['sum', 'mean'])
+            for col in present_resources:
+                total_key, avg_key = resource_columns[col]
+                performance['resource_usage'][total_key] = resource_stats.at['sum', col]
+                performance['resource_usage'][avg_key] = resource_stats.at['mean', col]
         
         # Calculate processing efficiency
-        successful_records = len(df[df['gdr_score_sinergia'].notna()]) if 'gdr_score_sinergia' in df.columns else 0
-        efficiency_rate = (successful_records / len(df)) * 100 if len(df) > 0 else 0
+        successful_records = int(df['gdr_score_sinergia'].notna().sum()) if 'gdr_score_sinergia' in columns else 0
+        efficiency_rate = successful_records * rate_factor
         performance['processing_efficiency']['overall_success_rate'] = efficiency_rate
         
         return performance
@@ -786,19 +1008,21 @@ class ResultReviewer:
         }
         
         # Identify new fields
-        original_fields = set(original_df.columns)
-        processed_fields = set(processed_df.columns)
-        new_fields = processed_fields - original_fields
+        new_fields = processed_df.columns.difference(original_df.columns)
         comparison['fields_added'] = list(new_fields)
         
-        # Analyze data enrichment
-        for field in new_fields:
-            if field in processed_df.columns:
-                filled_count = processed_df[field].notna().sum()
-                comparison['data_enrichment_summary'][field] = {
+        # Analyze data enrichment (one notna() pass over all new columns)
+        if len(new_fields) > 0:
+            filled_counts = processed_df[new_fields].notna().sum()
+            total_records = len(processed_df)
+            rate_factor = 100.0 / total_records if total_records else 0.0
+            comparison['data_enrichment_summary'] = {
+                field: {
                     'records_enriched': filled_count,
-                    'enrichment_rate': (filled_count / len(processed_df)) * 100
+                    'enrichment_rate': filled_count * rate_factor
                 }
+                for field, filled_count in filled_counts.items()
+            }
         
         return comparison
     
@@ -823,8 +1047,9 @@ class ResultReviewer:
             status_color = "🔴"
         
         # Count critical issues
-        critical_issues = len([issue for issue in quality_issues if issue.severity == 'critical'])
-        high_issues = len([issue for issue in quality_issues if issue.severity == 'high'])
+        severity_counts = _severity_counts(quality_issues)
+        critical_issues = int(severity_counts[_SEV_RANK['critical']])
+        high_issues = int(severity_counts[_SEV_RANK['high']])
         
         return {
             'overall_status': status,
@@ -866,124 +1091,149 @@ class ResultReviewer:
     def _identify_key_concerns(self, quality_issues: List[QualityIssue]) -> List[str]:
         """Identify key concerns from quality issues"""
         concerns = []
+        if not quality_issues:
+            return concerns
         
-        # Group by issue type
-        issue_type_counts = Counter(issue.issue_type for issue in quality_issues)
-        
-        for issue_type, count in issue_type_counts.most_common(5):
-            severity_levels = [issue.severity for issue in quality_issues if issue.issue_type == issue_type]
-            max_severity = max(severity_levels, key=['low', 'medium', 'high', 'critical'].index)
-            
-            concern_desc = f"{issue_type.replace('_', ' ').title()} ({count} cases, {max_severity} severity)"
+        # Count issues and track the highest severity per issue type
+        type_counts = Counter()
+        max_severity_rank = {}
+        for issue in quality_issues:
+            type_counts[issue.issue_type] += 1
+            rank = _SEV_RANK[issue.severity]
+            if rank > max_severity_rank.get(issue.issue_type, -1):
+                max_severity_rank[issue.issue_type] = rank
+        
+        for issue_type, count in type_counts.most_common(5):
+            max_severity = _SEVERITY_LEVELS[max_severity_rank[issue_type]]
+            concern_desc = f"{_humanize(issue_type)} ({count} cases, {max_severity} severity)"
             concerns.append(concern_desc)
         
         return concerns
     
     async def _generate_detailed_findings(self, df: pd.DataFrame, quality_issues: List[QualityIssue]) -> List[Dict[str, Any]]:
         """Generate detailed findings for each major issue category"""
-        findings = []
+        if not quality_issues:
+            return []
         
         # Group issues by category
         issues_by_category = defaultdict(list)
         for issue in quality_issues:
             issues_by_category[issue.category].append(issue)
         
-        for category, category_issues in issues_by_category.items():
-            finding = {
-                'category': category,
-                'title': f"{category.replace('_', ' ').title()} Analysis",
-                'issue_count': len(category_issues),
-                'severity_breakdown': Counter(issue.severity for issue in category_issues),
-                'top_issues': [],
-                'affected_fields': list(set(issue.field for issue in category_issues)),
-                'recommendations': []
-            }
-            
-            # Get top issues by severity
-            sorted_issues = sorted(category_issues, 
-                                 key=lambda x: ['low', 'medium', 'high', 'critical'].index(x.severity),
-                                 reverse=True)
-            
-            for issue in sorted_issues[:5]:  # Top 5 issues
-                finding['top_issues'].append({
-                    'severity': issue.severity,
-                    'type': issue.issue_type,
-                    'description': issue.description,
-                    'suggestion': issue.suggestion,
-                    'field': issue.field
-                })
-            
-            # Generate category-specific recommendations
-            if category == 'fake_data':
-                finding['recommendations'] = [
-                    "Implement stricter data validation during collection",
-                    "Add fake data detection to preprocessing pipeline",
-                    "Review data sources for quality issues"
-                ]
-            elif category == 'missing_data':
-                finding['recommendations'] = [
-                    "Improve data collection processes",
-                    "Configure additional data sources",
-                    "Implement data completion strategies"
-                ]
-            elif category == 'invalid_format':
-                finding['recommendations'] = [
-                    "Add format validation to input pipeline",
-                    "Standardize data formats across sources",
-                    "Implement data cleaning procedures"
-                ]
-            
-            findings.append(finding)
-        
-        return findings
+        return [_finding_for_category(category, category_issues)
+                for category, category_issues in issues_by_category.items()]
 
 
 # ===================================================================================
 # CLASS: ImprovementPlanner
 # ===================================================================================
 
+# Improvement recommendation templates, shared read-only by all planners
+_IMPROVEMENT_TEMPLATES = MappingProxyType({
+    'fake_data_detection': MappingProxyType({
+        'priority': 'critical',
+        'category': 'data_quality',
+        'title': 'Implement Advanced Fake Data Detection',
+        'description': 'Add comprehensive fake data detection to prevent invalid data from entering the system',
+        'implementation_complexity': 'medium',
+        'estimated_impact': 'high'
+    }),
+    'data_validation': MappingProxyType({
+        'priority': 'high',
+        'category': 'data_quality',
+        'title': 'Enhance Data Validation Pipeline',
+        'description': 'Strengthen data validation rules and processes',
+        'implementation_complexity': 'medium',
+        'estimated_impact': 'high'
+    }),
+    'enrichment_optimization': MappingProxyType({
+        'priority': 'medium',
+        'category': 'performance',
+        'title': 'Optimize Data Enrichment Process',
+        'description': 'Improve enrichment success rates and efficiency',
+        'implementation_complexity': 'high',
+        'estimated_impact': 'medium'
+    }),
+    'monitoring_system': MappingProxyType({
+        'priority': 'medium',
+        'category': 'system',
+        'title': 'Implement Quality Monitoring System',
+        'description': 'Add real-time quality monitoring and alerting',
+        'implementation_complexity': 'high',
+        'estimated_impact': 'medium'
+    })
+})
+
+# Sort order for recommendation priorities (unknown priorities sort last)
+_PRIORITY_ORDER = MappingProxyType({'critical': 0, 'high': 1, 'medium': 2, 'low': 3})
+
+# Roadmap phase per priority; 'high' additionally depends on implementation complexity
+_PHASE_BY_PRIORITY = MappingProxyType({'critical': 'immediate', 'medium': 'medium_term'})
+
+
+# Expected-outcome deltas per recommendation tag, checked in this order (first match wins).
+# Columns: fake data reduction (%), accuracy, overall score, completeness
+_OUTCOME_TAGS = ('fake_data', 'completeness', 'enrichment', 'validation')
+_OUTCOME_DELTAS = np.array([
+    [80, 15, 10, 0],
+    [0, 0, 15, 25],
+    [0, 0, 10, 15],
+    [0, 20, 12, 0]
+], dtype=np.int64)
+
+
+def _outcome_row(tags: FrozenSet[str]) -> int:
+    """Row of _OUTCOME_DELTAS that applies to a recommendation, or -1 if none"""
+    return next((row for row, tag in enumerate(_OUTCOME_TAGS) if tag in tags), -1)
+
+
+def _predict_state(overall_score: float, completeness: float, accuracy: float, fake_percentage: float,
+                   score_gain: int, completeness_gain: int, accuracy_gain: int,
+                   fake_reduction_pct: int) -> Tuple[float, float, float, float]:
+    """Apply improvement deltas to current metrics, capping scores at 100 and fake data at 0"""
+    return (
+        min(100, overall_score + score_gain),
+        min(100, completeness + completeness_gain),
+        min(100, accuracy + accuracy_gain),
+        max(0, fake_percentage * (1 - fake_reduction_pct/100))
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class _RecommendationColumns:
+    """Column-wise view of the scalar recommendation fields, for per-field scans"""
+    priority: Tuple[str, ...]
+    category: Tuple[str, ...]
+    complexity: Tuple[str, ...]
+    tags: Tuple[FrozenSet[str], ...]
+    
+    @classmethod
+    def from_recommendations(cls, recommendations: List[ImprovementRecommendation]) -> '_RecommendationColumns':
+        if not recommendations:
+            return cls((), (), (), ())
+        return cls(*zip(*((r.priority, r.category, r.implementation_complexity, r.tags) for r in recommendations)))
+
+
+def _roadmap_phase(rec: ImprovementRecommendation) -> str:
+    """Roadmap phase a recommendation belongs to"""
+    if rec.priority == 'high':
+        return 'short_term' if rec.implementation_complexity in ('low', 'medium') else 'medium_term'
+    return _PHASE_BY_PRIORITY.get(rec.priority, 'long_term')
+
+
 class ImprovementPlanner:
     """Creates actionable improvement plans based on review results"""
     
-    def __init__(self):
-        self.improvement_templates = self._initialize_improvement_templates()
+    def __init__(self, plan_cache_size: int = 32):
+        self.improvement_templates = _IMPROVEMENT_TEMPLATES
+        self.plan_cache_size = plan_cache_size
+        self._plan_cache: OrderedDict = OrderedDict()
     
-    def _initialize_improvement_templates(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize improvement recommendation templates"""
-        return {
-            'fake_data_detection': {
-                'priority': 'critical',
-                'category': 'data_quality',
-                'title': 'Implement Advanced Fake Data Detection',
-                'description': 'Add comprehensive fake data detection to prevent invalid data from entering the system',
-                'implementation_complexity': 'medium',
-                'estimated_impact': 'high'
-            },
-            'data_validation': {
-                'priority': 'high',
-                'category': 'data_quality',
-                'title': 'Enhance Data Validation Pipeline',
-                'description': 'Strengthen data validation rules and processes',
-                'implementation_complexity': 'medium',
-                'estimated_impact': 'high'
-            },
-            'enrichment_optimization': {
-                'priority': 'medium',
-                'category': 'performance',
-                'title': 'Optimize Data Enrichment Process',
-                'description': 'Improve enrichment success rates and efficiency',
-                'implementation_complexity': 'high',
-                'estimated_impact': 'medium'
-            },
-            'monitoring_system': {
-                'priority': 'medium',
-                'category': 'system',
-                'title': 'Implement Quality Monitoring System',
-                'description': 'Add real-time quality monitoring and alerting',
-                'implementation_complexity': 'high',
-                'estimated_impact': 'medium'
-            }
-        }
+    @staticmethod
+    def _plan_cache_key(review_report: Dict[str, Any], focus_areas: Optional[List[str]]) -> str:
+        """Fingerprint of the inputs a plan is derived from"""
+        payload = _dumps([review_report.get('quality_analysis', {}), focus_areas], sort_keys=True)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
     
     async def create_improvement_plan(self, 
                                     review_report: Dict[str, Any],
@@ -998,44 +1248,58 @@ class ImprovementPlanner:
         Returns:
             Detailed improvement plan
         """
+        cache_key = self._plan_cache_key(review_report, focus_areas)
+        cached_plan = self._plan_cache.get(cache_key)
+        if cached_plan is not None:
+            self._plan_cache.move_to_end(cache_key)
+            now = datetime.now()
+            improvement_plan = copy.deepcopy(cached_plan)
+            improvement_plan['plan_id'] = f"improvement_plan_{now:%Y%m%d_%H%M%S}"
+            improvement_plan['created_at'] = now.isoformat()
+            improvement_plan['based_on_review'] = review_report.get('timestamp')
+            logger.info("📋 Reusing improvement plan for unchanged review results")
+            return improvement_plan
+        
         logger.info("📋 Creating improvement plan...")
         
-        improvement_plan = {
-            'plan_id': f"improvement_plan_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            'created_at': datetime.now().isoformat(),
-            'based_on_review': review_report.get('timestamp'),
-            'summary': {},
-            'recommendations': [],
-            'implementation_roadmap': {},
-            'code_changes': {},
-            'expected_outcomes': {}
-        }
+        now = datetime.now()
         
         # Analyze review results
-        quality_metrics = review_report.get('quality_analysis', {}).get('metrics', {})
-        quality_issues = review_report.get('quality_analysis', {}).get('issues', [])
+        quality_analysis = review_report.get('quality_analysis', {})
+        quality_metrics = quality_analysis.get('metrics', {})
+        quality_issues = quality_analysis.get('issues', [])
         
         # Generate recommendations
         recommendations = await self._generate_recommendations(quality_issues, quality_metrics, focus_areas)
-        improvement_plan['recommendations'] = recommendations
-        
-        # Create implementation roadmap
-        roadmap = self._create_implementation_roadmap(recommendations)
-        improvement_plan['implementation_roadmap'] = roadmap
         
         # Generate code changes
         code_changes = await self._generate_code_changes(recommendations)
-        improvement_plan['code_changes'] = code_changes
+        
+        # Create implementation roadmap
+        roadmap = self._create_implementation_roadmap(recommendations)
         
         # Predict expected outcomes
         expected_outcomes = self._predict_expected_outcomes(recommendations, quality_metrics)
-        improvement_plan['expected_outcomes'] = expected_outcomes
         
-        # Create summary
-        improvement_plan['summary'] = self._create_plan_summary(recommendations, roadmap)
+        improvement_plan = {
+            'plan_id': f"improvement_plan_{now:%Y%m%d_%H%M%S}",
+            'created_at': now.isoformat(),
+            'based_on_review': review_report.get('timestamp'),
+            'summary': self._create_plan_summary(
+                recommendations, roadmap, _RecommendationColumns.from_recommendations(recommendations)
+            ),
+            'recommendations': recommendations,
+            'implementation_roadmap': roadmap,
+            'code_changes': code_changes,
+            'expected_outcomes': expected_outcomes
+        }
         
         logger.info(f"✅ Improvement plan created with {len(recommendations)} recommendations")
         
+        self._plan_cache[cache_key] = copy.deepcopy(improvement_plan)
+        if len(self._plan_cache) > self.plan_cache_size:
+            self._plan_cache.popitem(last=False)
+        
         return improvement_plan
     
     async def _generate_recommendations(self, 
@@ -1043,14 +1307,26 @@ class ImprovementPlanner:
                                       quality_metrics: Dict[str, Any],
                                       focus_areas: List[str] = None) -> List[ImprovementRecommendation]:
         """Generate specific improvement recommendations"""
+        # Nothing to recommend for issue-free results above every threshold
+        if (not quality_issues
+                and quality_metrics.get('completeness_score', 100) >= 70
+                and quality_metrics.get('enrichment_score', 100) >= 50):
+            return []
+        
         recommendations = []
         
-        # Analyze issue patterns
-        issue_categories = Counter(issue['category'] for issue in quality_issues)
-        issue_severities = Counter(issue['severity'] for issue in quality_issues)
+        # Analyze issue patterns in a single pass
+        issue_categories = Counter()
+        issue_severities = Counter()
+        fake_data_count = 0
+        for issue in quality_issues:
+            category = issue['category']
+            issue_categories[category] += 1
+            issue_severities[issue['severity']] += 1
+            if category == 'fake_data':
+                fake_data_count += 1
         
         # Fake data issues
-        fake_data_count = sum(1 for issue in quality_issues if issue['category'] == 'fake_data')
         if fake_data_count > 0:
             recommendations.append(ImprovementRecommendation(
                 priority='critical' if fake_data_count > 10 else 'high',
@@ -1070,7 +1346,8 @@ class ImprovementPlanner:
                     'src/core/lead_processor.py - Add validation step',
                     'src/features/contact_extraction.py - Add validation logic',
                     'src/agents/review_agent.py - Enhance detection rules'
-                ]
+                ],
+                tags=frozenset({'fake_data', 'fake_data_detection'})
             ))
         
         # Data completeness issues
@@ -1094,7 +1371,8 @@ class ImprovementPlanner:
                     'src/features/web_scraping.py - Add fallback sources',
                     'src/core/orchestrator.py - Add completion strategies',
                     'src/infrastructure/cache_system.py - Improve caching'
-                ]
+                ],
+                tags=frozenset({'completeness'})
             ))
         
         # Enrichment quality issues
@@ -1118,7 +1396,8 @@ class ImprovementPlanner:
                     'src/features/social_scraping.py - Optimize scraping',
                     'src/core/api_manager.py - Add new APIs',
                     'src/infrastructure/checkpoint_manager.py - Add monitoring'
-                ]
+                ],
+                tags=frozenset({'enrichment'})
             ))
         
         # High number of critical issues
@@ -1142,12 +1421,12 @@ class ImprovementPlanner:
                     'src/core/lead_processor.py - Add critical validations',
                     'src/agents/review_agent.py - Add alerting',
                     'src/infrastructure/ - Add monitoring system'
-                ]
+                ],
+                tags=frozenset()
             ))
         
         # Sort by priority
-        priority_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        recommendations.sort(key=lambda x: priority_order.get(x.priority, 4))
+        recommendations.sort(key=lambda x: _PRIORITY_ORDER.get(x.priority, 4))
         
         return recommendations
     
@@ -1163,42 +1442,32 @@ class ImprovementPlanner:
         }
         
         for rec in recommendations:
-            if rec.priority == 'critical':
-                phases['immediate'].append(rec)
-            elif rec.priority == 'high':
-                if rec.implementation_complexity in ['low', 'medium']:
-                    phases['short_term'].append(rec)
-                else:
-                    phases['medium_term'].append(rec)
-            elif rec.priority == 'medium':
-                phases['medium_term'].append(rec)
-            else:
-                phases['long_term'].append(rec)
+            phases[_roadmap_phase(rec)].append(rec.to_dict())
         
         # Estimate timelines
         roadmap = {
             'immediate': {
                 'timeline': '1-2 weeks',
                 'description': 'Critical issues requiring immediate attention',
-                'recommendations': [asdict(rec) for rec in phases['immediate']],
+                'recommendations': phases['immediate'],
                 'estimated_effort': f"{len(phases['immediate'])} x 2-3 days each"
             },
             'short_term': {
                 'timeline': '2-6 weeks',
                 'description': 'High priority improvements with manageable complexity',
-                'recommendations': [asdict(rec) for rec in phases['short_term']],
+                'recommendations': phases['short_term'],
                 'estimated_effort': f"{len(phases['short_term'])} x 3-5 days each"
             },
             'medium_term': {
                 'timeline': '2-4 months',
                 'description': 'Major improvements requiring significant development',
-                'recommendations': [asdict(rec) for rec in phases['medium_term']],
+                'recommendations': phases['medium_term'],
                 'estimated_effort': f"{len(phases['medium_term'])} x 1-2 weeks each"
             },
             'long_term': {
                 'timeline': '4-12 months',
                 'description': 'Long-term enhancements and optimizations',
-                'recommendations': [asdict(rec) for rec in phases['long_term']],
+                'recommendations': phases['long_term'],
                 'estimated_effort': f"{len(phases['long_term'])} x 2-4 weeks each"
             }
         }
@@ -1215,15 +1484,12 @@ class ImprovementPlanner:
             'deployment_changes': []
         }
         
-        all_code_changes = []
-        for rec in recommendations:
-            all_code_changes.extend(rec.code_changes_needed)
-        
-        # Group by file
+        # Group by file, collecting the recommendation tags in the same scan
         file_changes = defaultdict(list)
-        for change in all_code_changes:
-            if ' - ' in change:
-                file_path, description = change.split(' - ', 1)
+        plan_tags = set()
+        for rec in recommendations:
+            plan_tags.update(rec.tags)
+            for file_path, description in rec.parsed_code_changes:
                 file_changes[file_path].append(description)
         
         # Generate specific changes for each file
@@ -1236,14 +1502,14 @@ class ImprovementPlanner:
             }
         
         # Suggest new files based on recommendations
-        if any('fake data detection' in rec.title.lower() for rec in recommendations):
+        if 'fake_data_detection' in plan_tags:
             code_changes['new_files_to_create'].append({
                 'file_path': 'src/validators/fake_data_detector.py',
                 'description': 'Comprehensive fake data detection module',
                 'template': 'validation_module'
             })
         
-        if any('monitoring' in rec.title.lower() for rec in recommendations):
+        if 'monitoring' in plan_tags:
             code_changes['new_files_to_create'].append({
                 'file_path': 'src/monitoring/quality_monitor.py',
                 'description': 'Real-time quality monitoring system',
@@ -1263,31 +1529,18 @@ class ImprovementPlanner:
         current_fake_percentage = current_metrics.get('fake_data_percentage', 0)
         
         # Estimate improvements based on recommendation types
-        score_improvement = 0
-        completeness_improvement = 0
-        accuracy_improvement = 0
-        fake_data_reduction = 0
-        
-        for rec in recommendations:
-            if 'fake data' in rec.title.lower():
-                fake_data_reduction += 80  # 80% reduction in fake data
-                accuracy_improvement += 15
-                score_improvement += 10
-            elif 'completeness' in rec.title.lower():
-                completeness_improvement += 25
-                score_improvement += 15
-            elif 'enrichment' in rec.title.lower():
-                score_improvement += 10
-                completeness_improvement += 15
-            elif 'validation' in rec.title.lower():
-                accuracy_improvement += 20
-                score_improvement += 12
+        outcome_rows = np.fromiter((_outcome_row(rec.tags) for rec in recommendations),
+                                   dtype=np.intp, count=len(recommendations))
+        fake_data_reduction, accuracy_improvement, score_improvement, completeness_improvement = (
+            int(total) for total in _OUTCOME_DELTAS[outcome_rows[outcome_rows >= 0]].sum(axis=0)
+        )
         
         # Apply improvements with realistic caps
-        predicted_overall_score = min(100, current_overall_score + score_improvement)
-        predicted_completeness = min(100, current_completeness + completeness_improvement)
-        predicted_accuracy = min(100, current_accuracy + accuracy_improvement)
-        predicted_fake_percentage = max(0, current_fake_percentage * (1 - fake_data_reduction/100))
+        (predicted_overall_score, predicted_completeness,
+         predicted_accuracy, predicted_fake_percentage) = _predict_state(
+            current_overall_score, current_completeness, current_accuracy, current_fake_percentage,
+            score_improvement, completeness_improvement, accuracy_improvement, fake_data_reduction
+        )
         
         return {
             'current_state': {
@@ -1314,27 +1567,31 @@ class ImprovementPlanner:
     
     def _create_plan_summary(self, 
                            recommendations: List[ImprovementRecommendation],
-                           roadmap: Dict[str, Any]) -> Dict[str, Any]:
+                           roadmap: Dict[str, Any],
+                           columns: Optional[_RecommendationColumns] = None) -> Dict[str, Any]:
         """Create improvement plan summary"""
+        if columns is None:
+            columns = _RecommendationColumns.from_recommendations(recommendations)
         
         total_recommendations = len(recommendations)
-        critical_count = len([r for r in recommendations if r.priority == 'critical'])
-        high_count = len([r for r in recommendations if r.priority == 'high'])
+        priority_counts = Counter(columns.priority)
+        critical_count = priority_counts['critical']
+        high_count = priority_counts['high']
         
         return {
             'total_recommendations': total_recommendations,
             'by_priority': {
                 'critical': critical_count,
                 'high': high_count,
-                'medium': len([r for r in recommendations if r.priority == 'medium']),
-                'low': len([r for r in recommendations if r.priority == 'low'])
+                'medium': priority_counts['medium'],
+                'low': priority_counts['low']
             },
-            'by_category': dict(Counter(r.category for r in recommendations)),
-            'implementation_phases': len([phase for phase in roadmap.values() if phase['recommendations']]),
+            'by_category': dict(Counter(columns.category)),
+            'implementation_phases': sum(1 for phase in roadmap.values() if phase['recommendations']),
             'estimated_total_timeline': '2-6 months',
             'immediate_actions_required': critical_count > 0,
             'expected_impact': 'high' if critical_count > 0 or high_count > 2 else 'medium',
-            'complexity_assessment': 'high' if any(r.implementation_complexity == 'high' for r in recommendations) else 'medium'
+            'complexity_assessment': 'high' if 'high' in columns.complexity else 'medium'
         }
 
 
@@ -1342,14 +1599,192 @@ class ImprovementPlanner:
 # CLASS: LearningOptimizer
 # ===================================================================================
 
+# Per-report metric series of the performance trends, in stacking order
+_TREND_SERIES = ('quality_score_trend', 'fake_data_trend', 'completeness_trend', 'enrichment_trend')
+
+
+def _stack_trend_series(trends: Dict[str, Any]) -> np.ndarray:
+    """Stack the trend series into one (4, R) float64 array for vectorized reductions"""
+    return np.array([trends[name] for name in _TREND_SERIES], dtype=np.float64).reshape(len(_TREND_SERIES), -1)
+
+
+# Issue keys tallied across reports, as returned by LearningOptimizer._count_issues
+_ISSUE_COUNT_KEYS = ('issue_type', 'field', 'category', 'severity')
+_get_issue_count_keys = itemgetter(*_ISSUE_COUNT_KEYS)
+
+
+def _pattern_keywords(patterns: List[Dict[str, Any]], keywords: Tuple[str, ...]) -> Set[str]:
+    """Keywords occurring in any pattern name, lower-casing each name once"""
+    found = set()
+    for pattern in patterns:
+        name = pattern['pattern'].lower()
+        found.update(keyword for keyword in keywords if keyword in name)
+        if len(found) == len(keywords):
+            break
+    return found
+
+
+def _thaw(value: Any) -> Any:
+    """Mutable copy of a frozen template value: mappings become dicts and tuples become lists"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _from_template(template: MappingProxyType, **overrides) -> Dict[str, Any]:
+    """Fresh dict from a constant template (nested values copied); overrides keep the template's key order"""
+    result = _thaw(template)
+    result.update(overrides)
+    return result
+
+
+# Constant parts of the optimization opportunities ('description' is filled per call where dynamic)
+_OPPORTUNITY_TEMPLATES = MappingProxyType({
+    'fake_data': MappingProxyType({
+        'type': 'prevention_optimization',
+        'title': 'Implement Preventive Fake Data Detection',
+        'description': None,
+        'potential_impact': 'high',
+        'implementation_effort': 'medium',
+        'target_components': ('LeadProcessor', 'ContactExtraction'),
+        'expected_improvement': '70-90% reduction in fake data'
+    }),
+    'enrichment': MappingProxyType({
+        'type': 'enrichment_optimization',
+        'title': 'Optimize Data Enrichment Pipeline',
+        'description': None,
+        'potential_impact': 'medium',
+        'implementation_effort': 'high',
+        'target_components': ('SocialScraping', 'WebScraping'),
+        'expected_improvement': '30-50% increase in enrichment success'
+    }),
+    'validation': MappingProxyType({
+        'type': 'validation_optimization',
+        'title': 'Enhance Validation Pipeline',
+        'description': 'Multiple validation issues detected across reports',
+        'potential_impact': 'high',
+        'implementation_effort': 'medium',
+        'target_components': ('DataValidation', 'ReviewAgent'),
+        'expected_improvement': '40-60% reduction in validation errors'
+    })
+})
+
+_TEACHING_TEMPLATES = MappingProxyType({
+    'fake_data': MappingProxyType({
+        'target_component': 'LeadProcessor',
+        'teaching_focus': 'Fake Data Prevention',
+        'specific_lessons': (
+            'Add phone number validation before processing',
+            'Implement email domain validation',
+            'Add business name sanity checks',
+            'Create fake data pattern database',
+            'Implement confidence scoring for extracted data'
+        ),
+        'implementation_guidance': MappingProxyType({
+            'code_location': 'src/core/lead_processor.py',
+            'method_to_enhance': 'process_lead',
+            'new_validation_step': 'Add validate_input_data() call at start',
+            'required_imports': ('phonenumbers', 'validators', 'fake_data_detector')
+        }),
+        'expected_outcome': 'Prevent fake data from entering processing pipeline',
+        'priority': 'high'
+    }),
+    'quality': MappingProxyType({
+        'target_component': 'ReviewAgent',
+        'teaching_focus': 'Enhanced Quality Detection',
+        'specific_lessons': (
+            'Implement pattern-based quality scoring',
+            'Add historical comparison capabilities',
+            'Create quality trend analysis',
+            'Implement predictive quality alerts',
+            'Add automated quality reporting'
+        ),
+        'implementation_guidance': MappingProxyType({
+            'code_location': 'src/agents/review_agent.py',
+            'method_to_enhance': 'analyze_data_quality',
+            'new_features': ('pattern_analysis', 'trend_tracking', 'predictive_alerts'),
+            'required_dependencies': ('numpy', 'pandas', 'scikit-learn')
+        }),
+        'expected_outcome': 'Proactive quality issue detection and prevention',
+        'priority': 'medium'
+    }),
+    'enrichment': MappingProxyType({
+        'target_component': 'EnrichmentPipeline',
+        'teaching_focus': 'Success Rate Optimization',
+        'specific_lessons': (
+            'Implement intelligent retry mechanisms',
+            'Add data source prioritization',
+            'Create enrichment success tracking',
+            'Implement adaptive timeout handling',
+            'Add enrichment quality scoring'
+        ),
+        'implementation_guidance': MappingProxyType({
+            'code_location': 'src/features/social_scraping.py',
+            'method_to_enhance': 'scrape_social_data',
+            'optimization_areas': ('retry_logic', 'timeout_handling', 'success_tracking'),
+            'monitoring_additions': ('success_rates', 'response_times', 'error_patterns')
+        }),
+        'expected_outcome': '30-50% improvement in enrichment success rates',
+        'priority': 'medium'
+    })
+})
+
+# Piecewise classification tables: label = LABELS[bisect(BINS, value)]
+_HEALTH_BINS = (50, 70, 85)  # bisect_right: a score equal to a bin edge takes the upper label
+_HEALTH_LABELS = ('needs_attention', 'acceptable', 'good', 'excellent')
+_QUALITY_RISK_BINS = (50, 75)  # bisect_right
+_QUALITY_RISK_LABELS = ('high', 'medium', 'low')
+_FAKE_DATA_RISK_BINS = (5, 15)  # bisect_left: a percentage equal to a bin edge takes the lower label
+_FAKE_DATA_RISK_LABELS = ('low', 'medium', 'high')
+
+_STRICT_VALIDATION_RULES = MappingProxyType({
+    'enable_phone_validation': True,
+    'enable_email_validation': True,
+    'enable_business_name_validation': True,
+    'fake_data_detection_threshold': 0.8,
+    'validation_strictness': 'high'
+})
+
+_MONITORING_SETTINGS = MappingProxyType({
+    'enable_real_time_monitoring': True,
+    'quality_check_frequency': 'every_batch',
+    'alert_on_quality_degradation': True,
+    'track_performance_trends': True
+})
+
+
 class LearningOptimizer:
     """Teaches the main agent and optimizes system performance over time"""
     
-    def __init__(self):
-        self.learning_history = []
+    def __init__(self, trend_capacity: int = 4096, history_size: int = 256, full_history_size: int = 0):
+        # Compact per-pass summaries; full learning results only when full_history_size > 0
+        self.learning_history = deque(maxlen=history_size)
+        self._full_history = deque(maxlen=full_history_size)
         self.optimization_rules = []
-        self.performance_trends = defaultdict(list)
         self.teaching_modules = self._initialize_teaching_modules()
+        
+        # Fixed-size ring buffer of per-report metrics, one column per _TREND_SERIES entry
+        self.trend_capacity = trend_capacity
+        self._trend_buffer = np.zeros((trend_capacity, len(_TREND_SERIES)), dtype=np.float64)
+        self._trend_index = 0
+        self._trend_filled = 0
+    
+    def append_metrics(self, values: np.ndarray) -> None:
+        """Record metric rows (overall, fake data, completeness, enrichment) in the trend history"""
+        rows = np.atleast_2d(values)[-self.trend_capacity:]
+        positions = (self._trend_index + np.arange(len(rows))) % self.trend_capacity
+        self._trend_buffer[positions] = rows
+        self._trend_index = (self._trend_index + len(rows)) % self.trend_capacity
+        self._trend_filled = min(self._trend_filled + len(rows), self.trend_capacity)
+    
+    def get_trend_averages(self) -> Dict[str, float]:
+        """Average of each metric over the recorded trend history"""
+        if not self._trend_filled:
+            return {}
+        averages = self._trend_buffer[:self._trend_filled].mean(axis=0)
+        return dict(zip(_TREND_SERIES, averages.tolist()))
     
     def _initialize_teaching_modules(self) -> Dict[str, Dict[str, Any]]:
         """Initialize teaching modules for different components"""
@@ -1376,12 +1811,14 @@ class LearningOptimizer:
             }
         }
     
-    async def learn_from_reviews(self, review_reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def learn_from_reviews(self, review_reports: List[Dict[str, Any]], record: bool = True) -> Dict[str, Any]:
         """
         Learn from review results and create optimization strategies
         
         Args:
             review_reports: List of review reports to learn from
+            record: Add the reports to the trend and learning histories; pass False
+                when aggregating reports that were already learned from
             
         Returns:
             Learning insights and optimization recommendations
@@ -1398,51 +1835,76 @@ class LearningOptimizer:
             'system_insights': {}
         }
         
+        # Extract metrics once and stream the issues into the counters without collecting them
+        analyses = [report.get('quality_analysis', {}) for report in review_reports]
+        metrics_list = [analysis.get('metrics', {}) for analysis in analyses]
+        issue_counts = self._count_issues(chain.from_iterable(analysis.get('issues', ()) for analysis in analyses))
+        
         # Analyze patterns across reviews
-        patterns = await self._identify_patterns(review_reports)
+        patterns = self._identify_patterns(metrics_list, issue_counts)
         learning_results['patterns_identified'] = patterns
         
         # Find optimization opportunities
-        optimizations = await self._find_optimization_opportunities(review_reports, patterns)
+        optimizations = self._find_optimization_opportunities(metrics_list, patterns, issue_counts)
         learning_results['optimization_opportunities'] = optimizations
         
         # Generate teaching recommendations
-        teaching_recs = await self._generate_teaching_recommendations(patterns, optimizations)
+        teaching_recs = self._generate_teaching_recommendations(patterns, optimizations)
         learning_results['teaching_recommendations'] = teaching_recs
         
         # Analyze performance trends
-        trends = self._analyze_performance_trends(review_reports)
+        trends = self._analyze_performance_trends(metrics_list)
         learning_results['performance_trends'] = trends
+        if record and metrics_list:
+            self.append_metrics(_stack_trend_series(trends).T)
         
         # Generate system insights
-        insights = await self._generate_system_insights(review_reports, patterns)
+        insights = self._generate_system_insights(patterns, trends, issue_counts)
         learning_results['system_insights'] = insights
         
-        # Store learning results
-        self.learning_history.append(learning_results)
+        # Store a compact summary of the learning results
+        if record:
+            self.learning_history.append({
+                'timestamp': learning_results['timestamp'],
+                'reports_analyzed': learning_results['reports_analyzed'],
+                'patterns_identified': len(patterns),
+                'optimization_opportunities': len(optimizations),
+                'system_health': insights['system_health']
+            })
+            self._full_history.append(learning_results)
         
         logger.info(f"✅ Learning complete. Identified {len(patterns)} patterns and "
                    f"{len(optimizations)} optimization opportunities")
         
         return learning_results
     
-    async def _identify_patterns(self, review_reports: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Identify patterns across multiple review reports"""
+    @staticmethod
+    def _count_issues(issues: Iterable[Dict[str, Any]]) -> Dict[str, Counter]:
+        """Tally issue types, fields, categories and severities in one streaming pass"""
+        # Count distinct key combinations in C, then fold them into one Counter per key
+        # (first-appearance order, and therefore most_common ties, is preserved)
+        combination_counts = Counter(map(_get_issue_count_keys, issues))
+        counts = {key: Counter() for key in _ISSUE_COUNT_KEYS}
+        for combination, count in combination_counts.items():
+            for key, value in zip(_ISSUE_COUNT_KEYS, combination):
+                counts[key][value] += count
+        
+        return counts
+    
+    def _identify_patterns(self,
+                           metrics_list: List[Dict[str, Any]],
+                           issue_counts: Dict[str, Counter]) -> List[Dict[str, Any]]:
+        """Identify patterns across multiple review reports (one metrics dict per report)"""
         patterns = []
+        report_count = len(metrics_list)
         
-        # Collect all quality issues across reports
-        all_issues = []
-        for report in review_reports:
-            issues = report.get('quality_analysis', {}).get('issues', [])
-            all_issues.extend(issues)
-        
-        if not all_issues:
+        # No quality issues across reports
+        if not issue_counts['issue_type']:
             return patterns
         
         # Pattern 1: Recurring issue types
-        issue_type_counts = Counter(issue['issue_type'] for issue in all_issues)
-        for issue_type, count in issue_type_counts.most_common(5):
-            if count >= len(review_reports) * 0.5:  # Appears in 50%+ of reports
+        for issue_type, count in heapq.nlargest(5, issue_counts['issue_type'].items(), key=itemgetter(1)):
+            if count >= report_count * 0.5:  # Appears in 50%+ of reports
                 patterns.append({
                     'type': 'recurring_issue',
                     'pattern': f'Recurring {issue_type}',
@@ -1453,9 +1915,8 @@ class LearningOptimizer:
                 })
         
         # Pattern 2: Field-specific problems
-        field_issue_counts = Counter(issue['field'] for issue in all_issues)
-        for field, count in field_issue_counts.most_common(3):
-            if count >= len(review_reports) * 0.3:  # Appears in 30%+ of reports
+        for field, count in heapq.nlargest(3, issue_counts['field'].items(), key=itemgetter(1)):
+            if count >= report_count * 0.3:  # Appears in 30%+ of reports
                 patterns.append({
                     'type': 'field_specific_problem',
                     'pattern': f'Field {field} issues',
@@ -1467,13 +1928,13 @@ class LearningOptimizer:
         
         # Pattern 3: Quality score trends
         quality_scores = []
-        for report in review_reports:
-            score = report.get('quality_analysis', {}).get('metrics', {}).get('overall_score', 0)
+        for metrics in metrics_list:
+            score = metrics.get('overall_score', 0)
             if score > 0:
                 quality_scores.append(score)
         
         if len(quality_scores) >= 3:
-            avg_score = statistics.mean(quality_scores)
+            avg_score = sum(quality_scores) / len(quality_scores)
             score_trend = 'improving' if quality_scores[-1] > quality_scores[0] else 'declining'
             
             patterns.append({
@@ -1487,140 +1948,64 @@ class LearningOptimizer:
         
         return patterns
     
-    async def _find_optimization_opportunities(self, 
-                                            review_reports: List[Dict[str, Any]],
-                                            patterns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _find_optimization_opportunities(self, 
+                                         metrics_list: List[Dict[str, Any]],
+                                         patterns: List[Dict[str, Any]],
+                                         issue_counts: Dict[str, Counter]) -> List[Dict[str, Any]]:
         """Find specific optimization opportunities"""
         opportunities = []
         
+        report_count = len(metrics_list)
+        if not report_count:
+            return opportunities
+        
         # Opportunity 1: Fake data prevention
-        fake_data_issues = 0
-        for report in review_reports:
-            issues = report.get('quality_analysis', {}).get('issues', [])
-            fake_data_issues += len([i for i in issues if i['category'] == 'fake_data'])
+        fake_data_issues = issue_counts['category']['fake_data']
         
         if fake_data_issues > 0:
-            opportunities.append({
-                'type': 'prevention_optimization',
-                'title': 'Implement Preventive Fake Data Detection',
-                'description': f'Found {fake_data_issues} fake data issues. Implement prevention at input stage.',
-                'potential_impact': 'high',
-                'implementation_effort': 'medium',
-                'target_components': ['LeadProcessor', 'ContactExtraction'],
-                'expected_improvement': '70-90% reduction in fake data'
-            })
+            opportunities.append(_from_template(
+                _OPPORTUNITY_TEMPLATES['fake_data'],
+                description=f'Found {fake_data_issues} fake data issues. Implement prevention at input stage.'
+            ))
         
         # Opportunity 2: Enrichment optimization
-        low_enrichment_reports = 0
-        for report in review_reports:
-            enrichment_score = report.get('quality_analysis', {}).get('metrics', {}).get('enrichment_score', 100)
-            if enrichment_score < 50:
-                low_enrichment_reports += 1
-        
-        if low_enrichment_reports > len(review_reports) * 0.3:
-            opportunities.append({
-                'type': 'enrichment_optimization',
-                'title': 'Optimize Data Enrichment Pipeline',
-                'description': f'{low_enrichment_reports} reports show low enrichment rates',
-                'potential_impact': 'medium',
-                'implementation_effort': 'high',
-                'target_components': ['SocialScraping', 'WebScraping'],
-                'expected_improvement': '30-50% increase in enrichment success'
-            })
+        low_enrichment_reports = sum(1 for metrics in metrics_list if metrics.get('enrichment_score', 100) < 50)
+        
+        if low_enrichment_reports > report_count * 0.3:
+            opportunities.append(_from_template(
+                _OPPORTUNITY_TEMPLATES['enrichment'],
+                description=f'{low_enrichment_reports} reports show low enrichment rates'
+            ))
         
         # Opportunity 3: Validation pipeline optimization
-        recurring_validation_issues = [p for p in patterns if 'invalid' in p['pattern'].lower()]
-        if recurring_validation_issues:
-            opportunities.append({
-                'type': 'validation_optimization',
-                'title': 'Enhance Validation Pipeline',
-                'description': 'Multiple validation issues detected across reports',
-                'potential_impact': 'high',
-                'implementation_effort': 'medium',
-                'target_components': ['DataValidation', 'ReviewAgent'],
-                'expected_improvement': '40-60% reduction in validation errors'
-            })
+        if _pattern_keywords(patterns, ('invalid',)):
+            opportunities.append(_from_template(_OPPORTUNITY_TEMPLATES['validation']))
         
         return opportunities
     
-    async def _generate_teaching_recommendations(self, 
-                                               patterns: List[Dict[str, Any]],
-                                               opportunities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _generate_teaching_recommendations(self, 
+                                           patterns: List[Dict[str, Any]],
+                                           opportunities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Generate specific teaching recommendations for system components"""
         teaching_recs = []
         
+        pattern_keywords = _pattern_keywords(patterns, ('fake', 'quality'))
+        
         # Teaching recommendation for LeadProcessor
-        fake_data_patterns = [p for p in patterns if 'fake' in p['pattern'].lower()]
-        if fake_data_patterns:
-            teaching_recs.append({
-                'target_component': 'LeadProcessor',
-                'teaching_focus': 'Fake Data Prevention',
-                'specific_lessons': [
-                    'Add phone number validation before processing',
-                    'Implement email domain validation',
-                    'Add business name sanity checks',
-                    'Create fake data pattern database',
-                    'Implement confidence scoring for extracted data'
-                ],
-                'implementation_guidance': {
-                    'code_location': 'src/core/lead_processor.py',
-                    'method_to_enhance': 'process_lead',
-                    'new_validation_step': 'Add validate_input_data() call at start',
-                    'required_imports': ['phonenumbers', 'validators', 'fake_data_detector']
-                },
-                'expected_outcome': 'Prevent fake data from entering processing pipeline',
-                'priority': 'high'
-            })
+        if 'fake' in pattern_keywords:
+            teaching_recs.append(_from_template(_TEACHING_TEMPLATES['fake_data']))
         
         # Teaching recommendation for ReviewAgent
-        quality_patterns = [p for p in patterns if 'quality' in p['pattern'].lower()]
-        if quality_patterns:
-            teaching_recs.append({
-                'target_component': 'ReviewAgent',
-                'teaching_focus': 'Enhanced Quality Detection',
-                'specific_lessons': [
-                    'Implement pattern-based quality scoring',
-                    'Add historical comparison capabilities',
-                    'Create quality trend analysis',
-                    'Implement predictive quality alerts',
-                    'Add automated quality reporting'
-                ],
-                'implementation_guidance': {
-                    'code_location': 'src/agents/review_agent.py',
-                    'method_to_enhance': 'analyze_data_quality',
-                    'new_features': ['pattern_analysis', 'trend_tracking', 'predictive_alerts'],
-                    'required_dependencies': ['numpy', 'pandas', 'scikit-learn']
-                },
-                'expected_outcome': 'Proactive quality issue detection and prevention',
-                'priority': 'medium'
-            })
+        if 'quality' in pattern_keywords:
+            teaching_recs.append(_from_template(_TEACHING_TEMPLATES['quality']))
         
         # Teaching recommendation for enrichment optimization
-        enrichment_opportunities = [o for o in opportunities if 'enrichment' in o['title'].lower()]
-        if enrichment_opportunities:
-            teaching_recs.append({
-                'target_component': 'EnrichmentPipeline',
-                'teaching_focus': 'Success Rate Optimization',
-                'specific_lessons': [
-                    'Implement intelligent retry mechanisms',
-                    'Add data source prioritization',
-                    'Create enrichment success tracking',
-                    'Implement adaptive timeout handling',
-                    'Add enrichment quality scoring'
-                ],
-                'implementation_guidance': {
-                    'code_location': 'src/features/social_scraping.py',
-                    'method_to_enhance': 'scrape_social_data',
-                    'optimization_areas': ['retry_logic', 'timeout_handling', 'success_tracking'],
-                    'monitoring_additions': ['success_rates', 'response_times', 'error_patterns']
-                },
-                'expected_outcome': '30-50% improvement in enrichment success rates',
-                'priority': 'medium'
-            })
+        if any('enrichment' in o['title'].lower() for o in opportunities):
+            teaching_recs.append(_from_template(_TEACHING_TEMPLATES['enrichment']))
         
         return teaching_recs
     
-    def _analyze_performance_trends(self, review_reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_performance_trends(self, metrics_list: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze performance trends over time"""
         trends = {
             'quality_score_trend': [],
@@ -1630,34 +2015,41 @@ class LearningOptimizer:
             'trend_analysis': {}
         }
         
-        # Extract metrics over time
-        for report in review_reports:
-            metrics = report.get('quality_analysis', {}).get('metrics', {})
-            
-            trends['quality_score_trend'].append(metrics.get('overall_score', 0))
-            trends['fake_data_trend'].append(metrics.get('fake_data_percentage', 0))
-            trends['completeness_trend'].append(metrics.get('completeness_score', 0))
-            trends['enrichment_trend'].append(metrics.get('enrichment_score', 0))
+        quality_trend = trends['quality_score_trend']
+        fake_data_trend = trends['fake_data_trend']
+        completeness_trend = trends['completeness_trend']
+        enrichment_trend = trends['enrichment_trend']
+        
+        # Extract metrics over time in a single pass
+        for metrics in metrics_list:
+            quality_trend.append(metrics.get('overall_score', 0))
+            fake_data_trend.append(metrics.get('fake_data_percentage', 0))
+            completeness_trend.append(metrics.get('completeness_score', 0))
+            enrichment_trend.append(metrics.get('enrichment_score', 0))
         
         # Analyze trends
-        for trend_name, values in trends.items():
-            if trend_name != 'trend_analysis' and len(values) >= 2:
-                trend_direction = 'improving' if values[-1] > values[0] else 'declining'
-                avg_value = statistics.mean(values) if values else 0
-                
+        if len(metrics_list) >= 2:
+            series = _stack_trend_series(trends)
+            averages = series.mean(axis=1)
+            improving = series[:, -1] > series[:, 0]
+            
+            for i, trend_name in enumerate(_TREND_SERIES):
+                values = trends[trend_name]
                 trends['trend_analysis'][trend_name] = {
-                    'direction': trend_direction,
-                    'average': avg_value,
-                    'latest': values[-1] if values else 0,
-                    'change': values[-1] - values[0] if len(values) >= 2 else 0
+                    'direction': 'improving' if improving[i] else 'declining',
+                    'average': float(averages[i]),
+                    'latest': values[-1],
+                    'change': values[-1] - values[0]
                 }
         
         return trends
     
-    async def _generate_system_insights(self, 
-                                       review_reports: List[Dict[str, Any]],
-                                       patterns: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Generate high-level system insights"""
+    def _generate_system_insights(self, 
+                                  patterns: List[Dict[str, Any]],
+                                  trends: Dict[str, Any],
+                                  issue_counts: Dict[str, Counter]) -> Dict[str, Any]:
+        """Generate high-level system insights from the per-report metric series in the trends"""
+        
         insights = {
             'system_health': 'unknown',
             'key_strengths': [],
@@ -1667,35 +2059,21 @@ class LearningOptimizer:
             'risk_assessment': {}
         }
         
-        # Calculate average quality score
-        quality_scores = []
-        for report in review_reports:
-            score = report.get('quality_analysis', {}).get('metrics', {}).get('overall_score', 0)
-            if score > 0:
-                quality_scores.append(score)
+        series = _stack_trend_series(trends)
+        averages = series.mean(axis=1) if series.shape[1] else None
         
-        avg_quality = statistics.mean(quality_scores) if quality_scores else 0
+        # Calculate average quality score
+        quality_scores = series[0][series[0] > 0]
+        avg_quality = float(quality_scores.mean()) if quality_scores.size else 0
+        avg_fake = 0
         
         # Determine system health
-        if avg_quality >= 85:
-            insights['system_health'] = 'excellent'
-        elif avg_quality >= 70:
-            insights['system_health'] = 'good'
-        elif avg_quality >= 50:
-            insights['system_health'] = 'acceptable'
-        else:
-            insights['system_health'] = 'needs_attention'
+        insights['system_health'] = _HEALTH_LABELS[bisect.bisect_right(_HEALTH_BINS, avg_quality)]
         
         # Identify strengths and weaknesses
-        all_metrics = []
-        for report in review_reports:
-            metrics = report.get('quality_analysis', {}).get('metrics', {})
-            all_metrics.append(metrics)
-        
-        if all_metrics:
+        if averages is not None:
             # Check completeness scores
-            completeness_scores = [m.get('completeness_score', 0) for m in all_metrics]
-            avg_completeness = statistics.mean(completeness_scores) if completeness_scores else 0
+            avg_completeness = float(averages[2])
             
             if avg_completeness >= 80:
                 insights['key_strengths'].append('High data completeness')
@@ -1703,8 +2081,7 @@ class LearningOptimizer:
                 insights['critical_weaknesses'].append('Poor data completeness')
             
             # Check fake data percentages
-            fake_percentages = [m.get('fake_data_percentage', 0) for m in all_metrics]
-            avg_fake = statistics.mean(fake_percentages) if fake_percentages else 0
+            avg_fake = float(averages[1])
             
             if avg_fake <= 5:
                 insights['key_strengths'].append('Low fake data presence')
@@ -1712,8 +2089,7 @@ class LearningOptimizer:
                 insights['critical_weaknesses'].append('High fake data percentage')
             
             # Check enrichment scores
-            enrichment_scores = [m.get('enrichment_score', 0) for m in all_metrics]
-            avg_enrichment = statistics.mean(enrichment_scores) if enrichment_scores else 0
+            avg_enrichment = float(averages[3])
             
             if avg_enrichment >= 70:
                 insights['key_strengths'].append('Good enrichment coverage')
@@ -1731,21 +2107,18 @@ class LearningOptimizer:
         # Recommend focus areas based on patterns
         action_needed_patterns = [p for p in patterns if p.get('action_needed', False)]
         for pattern in action_needed_patterns[:3]:
-            focus_area = pattern['pattern'].replace('_', ' ').title()
+            focus_area = _humanize(pattern['pattern'])
             insights['recommended_focus_areas'].append(focus_area)
         
         # Risk assessment
-        critical_issues_count = sum(
-            len([i for i in report.get('quality_analysis', {}).get('issues', []) 
-                if i['severity'] == 'critical'])
-            for report in review_reports
-            )
+        critical_issues_count = issue_counts['severity']['critical']
         
+        data_quality_risk = _QUALITY_RISK_LABELS[bisect.bisect_right(_QUALITY_RISK_BINS, avg_quality)]
         insights['risk_assessment'] = {
-            'data_quality_risk': 'high' if avg_quality < 50 else 'medium' if avg_quality < 75 else 'low',
-            'fake_data_risk': 'high' if avg_fake > 15 else 'medium' if avg_fake > 5 else 'low',
+            'data_quality_risk': data_quality_risk,
+            'fake_data_risk': _FAKE_DATA_RISK_LABELS[bisect.bisect_left(_FAKE_DATA_RISK_BINS, avg_fake)],
             'system_reliability_risk': 'high' if critical_issues_count > 0 else 'low',
-            'overall_risk': 'high' if critical_issues_count > 0 or avg_quality < 50 else 'medium' if avg_quality < 75 else 'low'
+            'overall_risk': 'high' if critical_issues_count > 0 else data_quality_risk
         }
         
         return insights
@@ -1763,16 +2136,9 @@ class LearningOptimizer:
         
         # Configure validation rules based on learning
         patterns = learning_results.get('patterns_identified', [])
-        fake_data_patterns = [p for p in patterns if 'fake' in p['pattern'].lower()]
-        
-        if fake_data_patterns:
-            config['validation_rules'] = {
-                'enable_phone_validation': True,
-                'enable_email_validation': True,
-                'enable_business_name_validation': True,
-                'fake_data_detection_threshold': 0.8,
-                'validation_strictness': 'high'
-            }
+        
+        if _pattern_keywords(patterns, ('fake',)):
+            config['validation_rules'] = dict(_STRICT_VALIDATION_RULES)
         
         # Configure quality thresholds
         trends = learning_results.get('performance_trends', {})
@@ -1790,12 +2156,7 @@ class LearningOptimizer:
         # Configure monitoring based on identified issues
         opportunities = learning_results.get('optimization_opportunities', [])
         if opportunities:
-            config['monitoring_settings'] = {
-                'enable_real_time_monitoring': True,
-                'quality_check_frequency': 'every_batch',
-                'alert_on_quality_degradation': True,
-                'track_performance_trends': True
-            }
+            config['monitoring_settings'] = dict(_MONITORING_SETTINGS)
         
         return config
 
@@ -1804,10 +2165,125 @@ class LearningOptimizer:
 # MAIN REVIEW AGENT CLASS
 # ===================================================================================
 
+# Markdown "Key Metrics" rows: (label, metric, green threshold, yellow threshold, higher is better)
+_KEY_METRIC_ROWS = (
+    ('Data Completeness', 'completeness_score', 80, 60, True),
+    ('Data Accuracy', 'accuracy_score', 95, 85, True),
+    ('Data Consistency', 'consistency_score', 90, 75, True),
+    ('Enrichment Success', 'enrichment_score', 70, 50, True),
+    ('Fake Data Percentage', 'fake_data_percentage', 5, 15, False)
+)
+
+# Severity icons in report order
+_SEVERITY_ICONS = MappingProxyType({'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🟢'})
+
+# Static markdown report sections, built once at import instead of per report
+_REPORT_QUALITY_HEADER = """
+
+---
+
+## 🔍 Detailed Quality Analysis
+
+### Issue Breakdown
+"""
+
+_REPORT_TOP_ISSUES_HEADER = """
+
+### Top Quality Issues
+"""
+
+_REPORT_IMPROVEMENT_AREAS_HEADER = """
+
+### Priority Improvement Areas
+"""
+
+_REPORT_PLAN_HEADER = """
+
+---
+
+## 📋 Improvement Plan
+
+### Implementation Roadmap
+"""
+
+# Markdown "Expected Outcomes" rows: (label, metric, improvement key, improvement sign, unit)
+_OUTCOME_ROWS = (
+    ('Overall Score', 'overall_score', 'overall_score_gain', '+', ''),
+    ('Completeness', 'completeness_score', 'completeness_gain', '+', '%'),
+    ('Accuracy', 'accuracy_score', 'accuracy_gain', '+', '%'),
+    ('Fake Data', 'fake_data_percentage', 'fake_data_reduction', '-', '%')
+)
+
+_REPORT_OUTCOMES_HEADER = """
+### Expected Outcomes
+
+| Metric | Current | Predicted | Improvement |
+|--------|---------|-----------|-------------|
+"""
+
+_REPORT_LEARNING_HEADER = """
+
+---
+
+## 🧠 Learning & Optimization Insights
+
+### System Health Assessment
+"""
+
+_REPORT_NEXT_STEPS_HEADER = """
+
+---
+
+## 🎯 Immediate Next Steps
+
+"""
+
+_REPORT_TECHNICAL_HEADER = """
+
+---
+
+## 📝 Technical Details
+
+### Review Configuration
+- **Review Agent Version:** 2.0
+- **Analysis Components:** DataQualityAnalyzer, ResultReviewer, ImprovementPlanner, LearningOptimizer
+- **Validation Rules:** Advanced fake data detection, format validation, completeness checks
+- **Quality Thresholds:** Configurable based on historical performance
+
+### Data Sources Analyzed
+"""
+
+_REPORT_FOOTER = """
+
+---
+
+**Report Generated by AURA NEXUS Comprehensive Review Agent v2.0**  
+*Ensuring data quality and system optimization through intelligent analysis*
+"""
+
+
+def _status_icon(value: float, green: float, yellow: float, higher_is_better: bool = True) -> str:
+    """Traffic-light icon for a metric against its green/yellow thresholds"""
+    if higher_is_better:
+        return '🟢' if value >= green else '🟡' if value >= yellow else '🔴'
+    return '🟢' if value <= green else '🟡' if value <= yellow else '🔴'
+
+
+def _frame_fingerprint(df: pd.DataFrame) -> bytes:
+    """Content hash of df (columns, index and values); computed on every call so in-place edits are seen"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update('\x1f'.join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return digest.digest()
+
+
 class ComprehensiveReviewAgent:
     """Main Review Agent that orchestrates all quality assurance components"""
     
-    def __init__(self):
+    def __init__(self,
+                 review_cache_size: int = 32,
+                 review_cache_dir: Optional[Path] = None,
+                 session_log_dir: Optional[Path] = None):
         self.data_analyzer = DataQualityAnalyzer()
         self.result_reviewer = ResultReviewer(self.data_analyzer)
         self.improvement_planner = ImprovementPlanner()
@@ -1815,6 +2291,73 @@ class ComprehensiveReviewAgent:
         
         self.review_session_id = None
         self.session_reports = []
+        
+        # When set, issue lists are appended to a per-session JSON-lines log and kept out of memory
+        self.session_log_dir = Path(session_log_dir) if session_log_dir else None
+        if self.session_log_dir:
+            self.session_log_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Review reports keyed by a content hash of the inputs, recomputed on every call (LRU);
+        # persisted as pickles when a cache dir is given, which must therefore be trusted
+        self.review_cache_size = review_cache_size
+        self.review_cache_dir = Path(review_cache_dir) if review_cache_dir else None
+        if self.review_cache_dir:
+            self.review_cache_dir.mkdir(parents=True, exist_ok=True)
+        self._review_cache: OrderedDict = OrderedDict()
+    
+    @staticmethod
+    def _review_cache_key(results_df: pd.DataFrame, original_df: Optional[pd.DataFrame]) -> Optional[str]:
+        """Content fingerprint of the review inputs, or None when the frames cannot be hashed"""
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            for df in (results_df, original_df):
+                digest.update(b'\x00' if df is None else _frame_fingerprint(df))
+        except TypeError:
+            return None
+        return digest.hexdigest()
+    
+    def _load_cached_review(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached review report for key, from memory first and then from disk
+        
+        Disk entries are unpickled, so review_cache_dir must only hold files written by this agent.
+        """
+        cached = self._review_cache.get(key)
+        if cached is not None:
+            self._review_cache.move_to_end(key)
+            return cached
+        
+        if self.review_cache_dir:
+            cache_path = self.review_cache_dir / f"{key}.pkl"
+            if cache_path.exists():
+                try:
+                    with open(cache_path, 'rb') as f:
+                        cached = pickle.load(f)
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not load cached review {cache_path.name}: {e}")
+                    return None
+                self._remember_review(key, cached, persist=False)
+        
+        return cached
+    
+    def clear_review_cache(self):
+        """Drop all cached review reports, in memory and on disk"""
+        self._review_cache.clear()
+        if self.review_cache_dir:
+            for cache_path in self.review_cache_dir.glob("*.pkl"):
+                cache_path.unlink(missing_ok=True)
+    
+    def _remember_review(self, key: str, report: Dict[str, Any], persist: bool = True):
+        """Store a review report in the LRU cache (and on disk when configured)"""
+        self._review_cache[key] = report
+        if len(self._review_cache) > self.review_cache_size:
+            self._review_cache.popitem(last=False)
+        
+        if persist and self.review_cache_dir:
+            try:
+                with open(self.review_cache_dir / f"{key}.pkl", 'wb') as f:
+                    pickle.dump(report, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not persist review cache entry: {e}")
     
     async def start_review_session(self, session_name: str = None) -> str:
         """Start a new review session"""
@@ -1828,6 +2371,42 @@ class ComprehensiveReviewAgent:
         logger.info(f"🔍 Starting review session: {session_id}")
         return session_id
     
+    def _session_entry(self, package: Dict[str, Any]) -> Dict[str, Any]:
+        """Session copy of a package, with its issues moved to the session log when one is configured"""
+        if not self.session_log_dir:
+            return package
+        
+        quality_analysis = package['review_report'].get('quality_analysis', {})
+        issues = quality_analysis.get('issues', [])
+        
+        log_path = self.session_log_dir / f"{self.review_session_id}_issues.jsonl"
+        with open(log_path, 'ab') as f:
+            offset = f.tell()
+            f.writelines(_dumps(issue) + b'\n' for issue in issues)
+        
+        review_report = {**package['review_report'], 'quality_analysis': {**quality_analysis, 'issues': []}}
+        return {
+            **package,
+            'review_report': review_report,
+            'issues_log': {'path': str(log_path), 'offset': offset, 'count': len(issues)}
+        }
+    
+    def _load_full_report(self, index: int) -> Dict[str, Any]:
+        """Session report at index with its issue list restored from the session log"""
+        entry = self.session_reports[index]
+        issues_log = entry.get('issues_log')
+        if not issues_log:
+            return entry
+        
+        with open(issues_log['path'], 'rb') as f:
+            f.seek(issues_log['offset'])
+            issues = [json.loads(f.readline()) for _ in range(issues_log['count'])]
+        
+        quality_analysis = {**entry['review_report']['quality_analysis'], 'issues': issues}
+        package = {**entry, 'review_report': {**entry['review_report'], 'quality_analysis': quality_analysis}}
+        del package['issues_log']
+        return package
+    
     async def comprehensive_review(self,
                                  results_df: pd.DataFrame,
                                  original_df: pd.DataFrame = None,
@@ -1848,19 +2427,28 @@ class ComprehensiveReviewAgent:
         if not self.review_session_id:
             await self.start_review_session()
         
-        # 1. Detailed review
-        review_report = await self.result_reviewer.review_processing_results(
-            results_df, original_df
-        )
+        # 1. Detailed review (the report for unchanged inputs comes from the review cache)
+        cache_key = self._review_cache_key(results_df, original_df)
+        review_report = self._load_cached_review(cache_key) if cache_key else None
+        if review_report is not None:
+            # Restamped and recorded like a fresh review; plan, learning and summary are rebuilt below
+            review_report = copy.deepcopy(review_report)
+            review_report['timestamp'] = datetime.now().isoformat()
+            self.result_reviewer._store_review(review_report)
+            logger.info("♻️ Review report reused for unchanged input data")
+        else:
+            review_report = await self.result_reviewer.review_processing_results(
+                results_df, original_df
+            )
+            if cache_key:
+                self._remember_review(cache_key, copy.deepcopy(review_report))
         
-        # 2. Create improvement plan
-        improvement_plan = await self.improvement_planner.create_improvement_plan(
-            review_report
+        # 2-3. Create improvement plan and learn from results (both only read the review)
+        improvement_plan, learning_results = await asyncio.gather(
+            self.improvement_planner.create_improvement_plan(review_report),
+            self.learning_optimizer.learn_from_reviews([review_report])
         )
         
-        # 3. Learn from results
-        learning_results = await self.learning_optimizer.learn_from_reviews([review_report])
-        
         # 4. Create optimization config
         optimization_config = await self.learning_optimizer.create_optimization_config(
             learning_results
@@ -1887,7 +2475,7 @@ class ComprehensiveReviewAgent:
             comprehensive_package['markdown_report_path'] = markdown_report
         
         # Store in session
-        self.session_reports.append(comprehensive_package)
+        self.session_reports.append(self._session_entry(comprehensive_package))
         
         logger.info("✅ Comprehensive review completed successfully")
         
@@ -1899,41 +2487,47 @@ class ComprehensiveReviewAgent:
                                     learning_results: Dict[str, Any]) -> Dict[str, Any]:
         """Create comprehensive summary of all analyses"""
         
-        quality_metrics = review_report.get('quality_analysis', {}).get('metrics', {})
+        # Missing completeness/enrichment scores are not reported as problems
+        quality_metrics = QualityMetrics.from_dict(
+            review_report.get('quality_analysis', {}).get('metrics', {}),
+            completeness_score=100, enrichment_score=100
+        )
         improvement_summary = improvement_plan.get('summary', {})
         system_insights = learning_results.get('system_insights', {})
         
+        # Resolve shared lookups once
+        critical_count = improvement_summary.get('by_priority', {}).get('critical', 0)
+        
         return {
             'overall_assessment': {
-                'quality_score': quality_metrics.get('overall_score', 0),
+                'quality_score': quality_metrics.overall_score,
                 'system_health': system_insights.get('system_health', 'unknown'),
                 'improvement_potential': system_insights.get('improvement_potential', 'unknown'),
                 'immediate_action_required': improvement_summary.get('immediate_actions_required', False)
             },
             'key_findings': {
-                'fake_data_detected': quality_metrics.get('fake_data_percentage', 0) > 5,
-                'data_completeness_issues': quality_metrics.get('completeness_score', 100) < 70,
-                'enrichment_problems': quality_metrics.get('enrichment_score', 100) < 50,
-                'critical_issues_count': improvement_summary.get('by_priority', {}).get('critical', 0)
+                'fake_data_detected': quality_metrics.fake_data_percentage > 5,
+                'data_completeness_issues': quality_metrics.completeness_score < 70,
+                'enrichment_problems': quality_metrics.enrichment_score < 50,
+                'critical_issues_count': critical_count
             },
             'recommendations_summary': {
                 'total_recommendations': improvement_summary.get('total_recommendations', 0),
-                'critical_priority': improvement_summary.get('by_priority', {}).get('critical', 0),
+                'critical_priority': critical_count,
                 'estimated_timeline': improvement_summary.get('estimated_total_timeline', 'unknown'),
                 'expected_impact': improvement_summary.get('expected_impact', 'unknown')
             },
-            'next_steps': self._generate_next_steps(improvement_plan, system_insights)
+            'next_steps': self._generate_next_steps(critical_count, system_insights)
         }
     
     def _generate_next_steps(self,
-                           improvement_plan: Dict[str, Any],
+                           critical_count: int,
                            system_insights: Dict[str, Any]) -> List[str]:
         """Generate immediate next steps"""
         next_steps = []
         
         # Critical issues first
-        critical_recs = improvement_plan.get('summary', {}).get('by_priority', {}).get('critical', 0)
-        if critical_recs > 0:
+        if critical_count > 0:
             next_steps.append("🔴 Address critical issues immediately (see improvement plan)")
         
         # System health assessment
@@ -1947,8 +2541,9 @@ class ComprehensiveReviewAgent:
             next_steps.append("🚫 Implement fake data detection and prevention immediately")
         
         # Learning optimization
-        if len(system_insights.get('recommended_focus_areas', [])) > 0:
-            focus_area = system_insights['recommended_focus_areas'][0]
+        focus_areas = system_insights.get('recommended_focus_areas')
+        if focus_areas:
+            focus_area = focus_areas[0]
             next_steps.append(f"🎯 Focus optimization efforts on: {focus_area}")
         
         # Default steps if nothing critical
@@ -1972,20 +2567,51 @@ class ComprehensiveReviewAgent:
         session_id = comprehensive_package['session_id']
         report_file = output_path / f"{session_id}_comprehensive_review.md"
         
+        # Render and write in a worker thread so the event loop stays free during disk I/O
+        await asyncio.to_thread(self._write_markdown_report, comprehensive_package, report_file)
+        
+        logger.info(f"📄 Comprehensive markdown report saved: {report_file}")
+        
+        return str(report_file)
+    
+    def _write_markdown_report(self, comprehensive_package: Dict[str, Any], report_file: Path):
+        """Render the markdown report for a package and stream it to report_file"""
+        session_id = comprehensive_package['session_id']
+        generated_at = datetime.fromisoformat(comprehensive_package['timestamp']).strftime('%Y-%m-%d %H:%M:%S')
+        
         # Get data from package
         review_report = comprehensive_package['review_report']
         improvement_plan = comprehensive_package['improvement_plan']
         learning_results = comprehensive_package['learning_results']
         summary = comprehensive_package['summary']
         
-        quality_metrics = review_report.get('quality_analysis', {}).get('metrics', {})
-        quality_issues = review_report.get('quality_analysis', {}).get('issues', [])
+        quality_analysis = review_report.get('quality_analysis', {})
+        quality_metrics = QualityMetrics.from_dict(quality_analysis.get('metrics', {}))
+        quality_issues = quality_analysis.get('issues', [])
         
-        # Generate markdown content
-        markdown_content = f"""# AURA NEXUS - Comprehensive Quality Review Report
+        # Tally severities, types and categories in one pass, keeping two examples per type
+        issues_by_severity = Counter()
+        issue_type_counts = Counter()
+        issues_by_category = Counter()
+        examples_by_type = defaultdict(list)
+        for issue in quality_issues:
+            issue_type = issue['issue_type']
+            issues_by_severity[issue['severity']] += 1
+            issue_type_counts[issue_type] += 1
+            issues_by_category[issue['category']] += 1
+            examples = examples_by_type[issue_type]
+            if len(examples) < 2:
+                examples.append(issue)
+        
+        # Stream the report straight to disk through a 1 MiB buffer
+        with open(report_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            w = f.write
+            
+            # Generate markdown content
+            w(f"""# AURA NEXUS - Comprehensive Quality Review Report
 
 **Session ID:** {session_id}  
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  
+**Generated:** {generated_at}  
 **Review Agent:** ComprehensiveReviewAgent v2.0
 
 ---
@@ -1993,7 +2619,7 @@ class ComprehensiveReviewAgent:
 ## 📊 Executive Summary
 
 ### Overall Assessment
-- **Quality Score:** {quality_metrics.get('overall_score', 0):.1f}/100
+- **Quality Score:** {quality_metrics.overall_score:.1f}/100
 - **System Health:** {summary['overall_assessment']['system_health'].upper()}
 - **Improvement Potential:** {summary['overall_assessment']['improvement_potential'].upper()}
 - **Immediate Action Required:** {'YES' if summary['overall_assessment']['immediate_action_required'] else 'NO'}
@@ -2001,233 +2627,155 @@ class ComprehensiveReviewAgent:
 ### Key Metrics
 | Metric | Score | Status |
 |--------|--------|--------|
-| Data Completeness | {quality_metrics.get('completeness_score', 0):.1f}% | {'🟢' if quality_metrics.get('completeness_score', 0) >= 80 else '🟡' if quality_metrics.get('completeness_score', 0) >= 60 else '🔴'} |
-| Data Accuracy | {quality_metrics.get('accuracy_score', 0):.1f}% | {'🟢' if quality_metrics.get('accuracy_score', 0) >= 95 else '🟡' if quality_metrics.get('accuracy_score', 0) >= 85 else '🔴'} |
-| Data Consistency | {quality_metrics.get('consistency_score', 0):.1f}% | {'🟢' if quality_metrics.get('consistency_score', 0) >= 90 else '🟡' if quality_metrics.get('consistency_score', 0) >= 75 else '🔴'} |
-| Enrichment Success | {quality_metrics.get('enrichment_score', 0):.1f}% | {'🟢' if quality_metrics.get('enrichment_score', 0) >= 70 else '🟡' if quality_metrics.get('enrichment_score', 0) >= 50 else '🔴'} |
-| Fake Data Percentage | {quality_metrics.get('fake_data_percentage', 0):.1f}% | {'🟢' if quality_metrics.get('fake_data_percentage', 0) <= 5 else '🟡' if quality_metrics.get('fake_data_percentage', 0) <= 15 else '🔴'} |
-
-### Key Findings
-"""
-        
-        # Add key findings
-        findings = summary['key_findings']
-        if findings.get('fake_data_detected'):
-            markdown_content += f"- 🚫 **Fake data detected** - {quality_metrics.get('fake_data_percentage', 0):.1f}% of records\n"
-        
-        if findings.get('data_completeness_issues'):
-            markdown_content += f"- 📉 **Data completeness issues** - {quality_metrics.get('completeness_score', 0):.1f}% completeness\n"
-        
-        if findings.get('enrichment_problems'):
-            markdown_content += f"- 🔍 **Enrichment challenges** - {quality_metrics.get('enrichment_score', 0):.1f}% success rate\n"
-        
-        critical_count = findings.get('critical_issues_count', 0)
-        if critical_count > 0:
-            markdown_content += f"- 🔴 **{critical_count} critical issues** require immediate attention\n"
-        
-        markdown_content += f"""
-
----
-
-## 🔍 Detailed Quality Analysis
-
-### Issue Breakdown
-"""
-        
-        # Add issues breakdown
-        issues_by_severity = Counter(issue['severity'] for issue in quality_issues)
-        for severity in ['critical', 'high', 'medium', 'low']:
-            count = issues_by_severity.get(severity, 0)
-            if count > 0:
-                icon = {'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🟢'}[severity]
-                markdown_content += f"- {icon} **{severity.title()}:** {count} issues\n"
-        
-        # Add top issues
-        markdown_content += f"""
-
-### Top Quality Issues
-"""
-        
-        # Group issues by type and show top ones
-        issue_type_counts = Counter(issue['issue_type'] for issue in quality_issues)
-        for issue_type, count in issue_type_counts.most_common(5):
-            examples = [issue for issue in quality_issues if issue['issue_type'] == issue_type][:2]
+""")
+            for label, metric, green, yellow, higher_is_better in _KEY_METRIC_ROWS:
+                value = getattr(quality_metrics, metric)
+                w(f"| {label} | {value:.1f}% | {_status_icon(value, green, yellow, higher_is_better)} |\n")
+            w("\n### Key Findings\n")
             
-            markdown_content += f"""
-#### {issue_type.replace('_', ' ').title()} ({count} instances)
-"""
-            for example in examples:
-                markdown_content += f"- **Field:** {example['field']} - {example['description']}\n"
-                if example.get('suggestion'):
-                    markdown_content += f"  - *Suggestion:* {example['suggestion']}\n"
-        
-        # Add improvement areas
-        improvement_areas = quality_metrics.get('improvement_areas', [])
-        if improvement_areas:
-            markdown_content += f"""
-
-### Priority Improvement Areas
-"""
-            for i, area in enumerate(improvement_areas[:5], 1):
-                markdown_content += f"{i}. {area}\n"
-        
-        markdown_content += f"""
-
----
-
-## 📋 Improvement Plan
-
-### Implementation Roadmap
-"""
-        
-        # Add roadmap
-        roadmap = improvement_plan.get('implementation_roadmap', {})
-        for phase, details in roadmap.items():
-            if details.get('recommendations'):
-                markdown_content += f"""
-#### {phase.replace('_', ' ').title()} ({details['timeline']})
+            # Add key findings
+            findings = summary['key_findings']
+            if findings.get('fake_data_detected'):
+                w(f"- 🚫 **Fake data detected** - {quality_metrics.fake_data_percentage:.1f}% of records\n")
+            
+            if findings.get('data_completeness_issues'):
+                w(f"- 📉 **Data completeness issues** - {quality_metrics.completeness_score:.1f}% completeness\n")
+            
+            if findings.get('enrichment_problems'):
+                w(f"- 🔍 **Enrichment challenges** - {quality_metrics.enrichment_score:.1f}% success rate\n")
+            
+            critical_count = findings.get('critical_issues_count', 0)
+            if critical_count > 0:
+                w(f"- 🔴 **{critical_count} critical issues** require immediate attention\n")
+            
+            w(_REPORT_QUALITY_HEADER)
+            
+            # Add issues breakdown
+            for severity in _SEVERITY_ICONS:
+                count = issues_by_severity.get(severity, 0)
+                if count > 0:
+                    w(f"- {_SEVERITY_ICONS[severity]} **{severity.title()}:** {count} issues\n")
+            
+            # Add top issues
+            w(_REPORT_TOP_ISSUES_HEADER)
+            
+            # Group issues by type and show top ones (most_common(k) is a heapq.nlargest
+            # selection over the distinct types, not a full sort)
+            for issue_type, count in issue_type_counts.most_common(5):
+                w(f"""
+#### {_humanize(issue_type)} ({count} instances)
+""")
+                for example in examples_by_type[issue_type]:
+                    w(f"- **Field:** {example['field']} - {example['description']}\n")
+                    if example.get('suggestion'):
+                        w(f"  - *Suggestion:* {example['suggestion']}\n")
+            
+            # Add improvement areas
+            improvement_areas = quality_metrics.improvement_areas
+            if improvement_areas:
+                w(_REPORT_IMPROVEMENT_AREAS_HEADER)
+                f.writelines(f"{i}. {area}\n" for i, area in enumerate(improvement_areas[:5], 1))
+            
+            w(_REPORT_PLAN_HEADER)
+            
+            # Add roadmap
+            roadmap = improvement_plan.get('implementation_roadmap', {})
+            for phase, details in roadmap.items():
+                if details.get('recommendations'):
+                    w(f"""
+#### {_humanize(phase)} ({details['timeline']})
 *{details['description']}*
 
-"""
-                for rec in details['recommendations'][:3]:  # Show top 3 per phase
-                    markdown_content += f"- **{rec['title']}** ({rec['priority']} priority)\n"
-                    markdown_content += f"  - {rec['description']}\n"
-                    if rec.get('action_items'):
-                        for action in rec['action_items'][:2]:  # Show top 2 actions
-                            markdown_content += f"    - {action}\n"
-                markdown_content += "\n"
-        
-        # Add expected outcomes
-        expected_outcomes = improvement_plan.get('expected_outcomes', {})
-        if expected_outcomes:
-            current_state = expected_outcomes.get('current_state', {})
-            predicted_state = expected_outcomes.get('predicted_state', {})
-            improvements = expected_outcomes.get('expected_improvements', {})
+""")
+                    for rec in details['recommendations'][:3]:  # Show top 3 per phase
+                        w(f"- **{rec['title']}** ({rec['priority']} priority)\n")
+                        w(f"  - {rec['description']}\n")
+                        if rec.get('action_items'):
+                            for action in rec['action_items'][:2]:  # Show top 2 actions
+                                w(f"    - {action}\n")
+                    w("\n")
             
-            markdown_content += f"""
-### Expected Outcomes
-
-| Metric | Current | Predicted | Improvement |
-|--------|---------|-----------|-------------|
-| Overall Score | {current_state.get('overall_score', 0):.1f} | {predicted_state.get('overall_score', 0):.1f} | +{improvements.get('overall_score_gain', 0):.1f} |
-| Completeness | {current_state.get('completeness_score', 0):.1f}% | {predicted_state.get('completeness_score', 0):.1f}% | +{improvements.get('completeness_gain', 0):.1f}% |
-| Accuracy | {current_state.get('accuracy_score', 0):.1f}% | {predicted_state.get('accuracy_score', 0):.1f}% | +{improvements.get('accuracy_gain', 0):.1f}% |
-| Fake Data | {current_state.get('fake_data_percentage', 0):.1f}% | {predicted_state.get('fake_data_percentage', 0):.1f}% | -{improvements.get('fake_data_reduction', 0):.1f}% |
-
-*Confidence Level: {expected_outcomes.get('confidence_level', 0)*100:.0f}%*
-"""
-        
-        markdown_content += f"""
-
----
-
-## 🧠 Learning & Optimization Insights
-
-### System Health Assessment
-"""
-        
-        # Add system insights
-        system_insights = learning_results.get('system_insights', {})
-        
-        markdown_content += f"- **Overall Health:** {system_insights.get('system_health', 'unknown').title()}\n"
-        markdown_content += f"- **Improvement Potential:** {system_insights.get('improvement_potential', 'unknown').title()}\n"
-        
-        strengths = system_insights.get('key_strengths', [])
-        if strengths:
-            markdown_content += f"\n**Key Strengths:**\n"
-            for strength in strengths:
-                markdown_content += f"- ✅ {strength}\n"
-        
-        weaknesses = system_insights.get('critical_weaknesses', [])
-        if weaknesses:
-            markdown_content += f"\n**Critical Weaknesses:**\n"
-            for weakness in weaknesses:
-                markdown_content += f"- ❌ {weakness}\n"
-        
-        # Add risk assessment
-        risk_assessment = system_insights.get('risk_assessment', {})
-        if risk_assessment:
-            markdown_content += f"""
+            # Add expected outcomes
+            expected_outcomes = improvement_plan.get('expected_outcomes', {})
+            if expected_outcomes:
+                current_state = expected_outcomes.get('current_state', {})
+                predicted_state = expected_outcomes.get('predicted_state', {})
+                improvements = expected_outcomes.get('expected_improvements', {})
+                
+                w(_REPORT_OUTCOMES_HEADER)
+                for label, metric, improvement, sign, unit in _OUTCOME_ROWS:
+                    w(f"| {label} | {current_state.get(metric, 0):.1f}{unit} | "
+                      f"{predicted_state.get(metric, 0):.1f}{unit} | "
+                      f"{sign}{improvements.get(improvement, 0):.1f}{unit} |\n")
+                w(f"\n*Confidence Level: {expected_outcomes.get('confidence_level', 0)*100:.0f}%*\n")
+            
+            w(_REPORT_LEARNING_HEADER)
+            
+            # Add system insights
+            system_insights = learning_results.get('system_insights', {})
+            
+            w(f"- **Overall Health:** {system_insights.get('system_health', 'unknown').title()}\n")
+            w(f"- **Improvement Potential:** {system_insights.get('improvement_potential', 'unknown').title()}\n")
+            
+            strengths = system_insights.get('key_strengths', [])
+            if strengths:
+                w("\n**Key Strengths:**\n")
+                f.writelines(f"- ✅ {strength}\n" for strength in strengths)
+            
+            weaknesses = system_insights.get('critical_weaknesses', [])
+            if weaknesses:
+                w("\n**Critical Weaknesses:**\n")
+                f.writelines(f"- ❌ {weakness}\n" for weakness in weaknesses)
+            
+            # Add risk assessment
+            risk_assessment = system_insights.get('risk_assessment', {})
+            if risk_assessment:
+                w(f"""
 
 ### Risk Assessment
 - **Data Quality Risk:** {risk_assessment.get('data_quality_risk', 'unknown').title()}
 - **Fake Data Risk:** {risk_assessment.get('fake_data_risk', 'unknown').title()}
 - **System Reliability Risk:** {risk_assessment.get('system_reliability_risk', 'unknown').title()}
 - **Overall Risk:** {risk_assessment.get('overall_risk', 'unknown').title()}
-"""
-        
-        markdown_content += f"""
-
----
-
-## 🎯 Immediate Next Steps
-
-"""
-        
-        # Add next steps
-        next_steps = summary.get('next_steps', [])
-        for i, step in enumerate(next_steps, 1):
-            markdown_content += f"{i}. {step}\n"
-        
-        markdown_content += f"""
+""")
+            
+            w(_REPORT_NEXT_STEPS_HEADER)
+            
+            # Add next steps
+            next_steps = summary.get('next_steps', [])
+            f.writelines(f"{i}. {step}\n" for i, step in enumerate(next_steps, 1))
+            
+            w(f"""
 
 ---
 
 ## 📊 Detailed Statistics
 
 ### Processing Performance
-- **Total Records:** {quality_metrics.get('total_records', 0):,}
-- **Valid Records:** {quality_metrics.get('valid_records', 0):,}
+- **Total Records:** {quality_metrics.total_records:,}
+- **Valid Records:** {quality_metrics.valid_records:,}
 - **Records with Issues:** {len(quality_issues):,}
 
 ### Issue Distribution
-"""
-        
-        # Add detailed statistics
-        issues_by_category = Counter(issue['category'] for issue in quality_issues)
-        for category, count in issues_by_category.items():
-            percentage = (count / len(quality_issues) * 100) if quality_issues else 0
-            markdown_content += f"- **{category.replace('_', ' ').title()}:** {count} issues ({percentage:.1f}%)\n"
-        
-        markdown_content += f"""
-
----
-
-## 📝 Technical Details
-
-### Review Configuration
-- **Review Agent Version:** 2.0
-- **Analysis Components:** DataQualityAnalyzer, ResultReviewer, ImprovementPlanner, LearningOptimizer
-- **Validation Rules:** Advanced fake data detection, format validation, completeness checks
-- **Quality Thresholds:** Configurable based on historical performance
-
-### Data Sources Analyzed
-"""
-        
-        # Add technical details
-        performance_analysis = review_report.get('performance_analysis', {})
-        successful_enrichments = performance_analysis.get('successful_enrichments', {})
-        
-        for field, stats in successful_enrichments.items():
-            success_rate = stats.get('rate', 0)
-            count = stats.get('count', 0)
-            markdown_content += f"- **{field}:** {count:,} records ({success_rate:.1f}% success rate)\n"
-        
-        markdown_content += f"""
-
----
-
-**Report Generated by AURA NEXUS Comprehensive Review Agent v2.0**  
-*Ensuring data quality and system optimization through intelligent analysis*
-"""
-        
-        # Write to file
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        logger.info(f"📄 Comprehensive markdown report saved: {report_file}")
-        
-        return str(report_file)
+""")
+            
+            # Add detailed statistics
+            for category, count in issues_by_category.items():
+                percentage = (count / len(quality_issues) * 100) if quality_issues else 0
+                w(f"- **{_humanize(category)}:** {count} issues ({percentage:.1f}%)\n")
+            
+            w(_REPORT_TECHNICAL_HEADER)
+            
+            # Add technical details
+            performance_analysis = review_report.get('performance_analysis', {})
+            successful_enrichments = performance_analysis.get('successful_enrichments', {})
+            
+            f.writelines(
+                f"- **{field}:** {stats.get('count', 0):,} records ({stats.get('rate', 0):.1f}% success rate)\n"
+                for field, stats in successful_enrichments.items()
+            )
+            
+            w(_REPORT_FOOTER)
     
     async def get_session_summary(self) -> Dict[str, Any]:
         """Get summary of current review session"""
@@ -2241,21 +2789,36 @@ class ComprehensiveReviewAgent:
             'session_trends': self._analyze_session_trends()
         }
     
+    async def learn_from_session(self) -> Dict[str, Any]:
+        """Learn from all review reports of the current session in a single pass
+        
+        Each report was already recorded when it was reviewed, so this only aggregates.
+        """
+        if not self.session_reports:
+            return {'message': 'No reviews conducted in this session'}
+        
+        review_reports = [
+            self._load_full_report(index)['review_report']
+            for index in range(len(self.session_reports))
+        ]
+        return await self.learning_optimizer.learn_from_reviews(review_reports, record=False)
+    
     def _analyze_session_trends(self) -> Dict[str, Any]:
         """Analyze trends across session reviews"""
         if len(self.session_reports) < 2:
             return {'message': 'Insufficient data for trend analysis'}
         
         # Extract quality scores over time
-        quality_scores = []
-        for report in self.session_reports:
-            score = report['review_report']['quality_analysis']['metrics']['overall_score']
-            quality_scores.append(score)
+        quality_scores = np.fromiter(
+            (report['review_report']['quality_analysis']['metrics']['overall_score']
+             for report in self.session_reports),
+            dtype=np.float64, count=len(self.session_reports)
+        )
         
         return {
             'quality_trend': 'improving' if quality_scores[-1] > quality_scores[0] else 'declining',
-            'average_quality': statistics.mean(quality_scores),
-            'quality_range': {'min': min(quality_scores), 'max': max(quality_scores)},
+            'average_quality': float(quality_scores.mean()),
+            'quality_range': {'min': float(quality_scores.min()), 'max': float(quality_scores.max())},
             'total_improvements_suggested': sum(
                 len(report['improvement_plan']['recommendations']) 
                 for report in self.session_reports
@@ -2267,6 +2830,16 @@ class ComprehensiveReviewAgent:
 # UTILITY FUNCTIONS
 # ===================================================================================
 
+async def _load_table(path: str) -> pd.DataFrame:
+    """Read an Excel/CSV file in a worker thread so the event loop stays free.
+    
+    Files are read whole rather than in chunks: the consistency check groups records by
+    business name across the entire frame, so per-chunk analysis would miss duplicates.
+    """
+    reader = pd.read_excel if path.endswith('.xlsx') else pd.read_csv
+    return await asyncio.to_thread(reader, path)
+
+
 async def run_comprehensive_review(df_path: str, 
                                  output_dir: str = None,
                                  original_df_path: str = None) -> Dict[str, Any]:
@@ -2281,18 +2854,11 @@ async def run_comprehensive_review(df_path: str,
     Returns:
         Comprehensive review results
     """
-    # Load data
-    if df_path.endswith('.xlsx'):
-        df = pd.read_excel(df_path)
-    else:
-        df = pd.read_csv(df_path)
-    
-    original_df = None
-    if original_df_path:
-        if original_df_path.endswith('.xlsx'):
-            original_df = pd.read_excel(original_df_path)
-        else:
-            original_df = pd.read_csv(original_df_path)
+    # Load both inputs concurrently
+    df, original_df = await asyncio.gather(
+        _load_table(df_path),
+        _load_table(original_df_path) if original_df_path else asyncio.sleep(0, result=None)
+    )
     
     # Create review agent and run comprehensive review
     review_agent = ComprehensiveReviewAgent()
@@ -2306,34 +2872,36 @@ async def run_comprehensive_review(df_path: str,
     return results
 
 
-def create_fake_data_summary(issues: List[QualityIssue]) -> Dict[str, Any]:
-    """Create summary of fake data issues for quick analysis"""
-    fake_issues = [issue for issue in issues if issue.category == 'fake_data']
+def create_fake_data_summary(issues: List[Any]) -> Dict[str, Any]:
+    """Create summary of fake data issues for quick analysis
     
-    if not fake_issues:
+    Accepts QualityIssue instances or their dict form (as stored in review reports).
+    """
+    issues_df = pd.DataFrame(issues)
+    if issues_df.empty:
         return {'message': 'No fake data detected'}
     
-    fake_summary = {
-        'total_fake_entries': len(fake_issues),
-        'fake_by_type': Counter(issue.issue_type for issue in fake_issues),
-        'fake_by_field': Counter(issue.field for issue in fake_issues),
-        'examples': []
-    }
-    
-    # Add examples
-    for issue_type in fake_summary['fake_by_type'].keys():
-        examples = [issue for issue in fake_issues if issue.issue_type == issue_type][:3]
-        fake_summary['examples'].extend([
-            {
-                'type': issue.issue_type,
-                'field': issue.field,
-                'value': issue.value,
-                'record_id': issue.record_id
-            }
-            for issue in examples
-        ])
+    fake_df = issues_df[issues_df['category'] == 'fake_data']
+    if fake_df.empty:
+        return {'message': 'No fake data detected'}
     
-    return fake_summary
+    fake_by_type = fake_df['issue_type'].value_counts(sort=False)
+    
+    # Up to three examples per type, grouped in order of first appearance
+    examples_df = fake_df.groupby('issue_type', sort=False).head(3)
+    type_order = pd.Series(np.arange(len(fake_by_type)), index=fake_by_type.index)
+    examples_df = examples_df.iloc[
+        np.argsort(examples_df['issue_type'].map(type_order).to_numpy(), kind='stable')
+    ]
+    
+    return {
+        'total_fake_entries': len(fake_df),
+        'fake_by_type': Counter(fake_by_type.to_dict()),
+        'fake_by_field': Counter(fake_df['field'].value_counts(sort=False).to_dict()),
+        'examples': examples_df[['issue_type', 'field', 'value', 'record_id']]
+            .rename(columns={'issue_type': 'type'})
+            .to_dict('records')
+    }
 
 
 # ===================================================================================
@@ -2369,7 +2937,7 @@ if __name__ == "__main__":
         print(f"Recommendations: {results['summary']['recommendations_summary']['total_recommendations']}")
         
         # Show fake data summary
-        issues = [QualityIssue(**issue) for issue in results['review_report']['quality_analysis']['issues']]
+        issues = results['review_report']['quality_analysis']['issues']
         fake_summary = create_fake_data_summary(issues)
         print(f"\nFake data summary: {fake_summary}")
     
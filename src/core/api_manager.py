@@ -5,59 +5,181 @@ Centraliza o gerenciamento de todas as APIs externas
 """
 
 import os
+import copy
+import random
+import hashlib
+import json
+import time
 import asyncio
+import contextlib
+import functools
 import aiohttp
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+import yarl
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Tuple, Callable, Awaitable, AsyncIterator
 import logging
 from dotenv import load_dotenv
-import googlemaps
-import openai
-from anthropic import Anthropic
-import google.generativeai as genai
+# orjson é dependência declarada; o fallback para a stdlib só mantém instalações mínimas funcionando
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# SDKs das APIs são importados em initialize(), só para as APIs com credencial configurada
 
 # Carrega variáveis de ambiente
 load_dotenv()
 
 logger = logging.getLogger("AURA_NEXUS.APIManager")
 
+# Opções padrão das requisições ao Claude (sobrescritas por kwargs da chamada)
+_ANTHROPIC_REQUEST_DEFAULTS = MappingProxyType({'max_tokens': 1000})
+
+# Hosts acessados pela sessão aiohttp compartilhada, por API
+_SESSION_HOSTS = MappingProxyType({
+    'google_maps': 'maps.googleapis.com',
+    'google_cse': 'www.googleapis.com'
+})
+
+# Status HTTP transitórios que justificam nova tentativa
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Status da Places API (em respostas HTTP 200) que indicam falha transitória
+_RETRYABLE_MAPS_STATUSES = frozenset({'OVER_QUERY_LIMIT', 'UNKNOWN_ERROR'})
+
+# Provedores de LLM com método complete_<provedor>
+_LLM_PROVIDERS = ('openai', 'anthropic', 'gemini', 'deepseek')
+
+# Campos pedidos à Places Details API
+_PLACE_DETAILS_FIELDS = ','.join([
+    'name', 'formatted_address', 'formatted_phone_number',
+    'website', 'rating', 'user_ratings_total', 'opening_hours',
+    'photo', 'type', 'geometry', 'business_status'
+])
+
+# Parser JSON para corpos de resposta (orjson; stdlib só no fallback)
+_json_loads = orjson.loads if orjson else json.loads
+
+# Variáveis de ambiente com as credenciais das APIs
+_API_KEY_NAMES = (
+    'GOOGLE_MAPS_API_KEY', 'OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'GOOGLE_AI_API_KEY',
+    'DEEPSEEK_API_KEY', 'GOOGLE_CSE_API_KEY', 'GOOGLE_CSE_CX', 'APIFY_API_TOKEN'
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_api_keys() -> Mapping[str, str]:
+    """Lê as credenciais configuradas uma única vez por processo (somente leitura)"""
+    return MappingProxyType({
+        name: os.environ[name] for name in _API_KEY_NAMES if os.environ.get(name)
+    })
+
+
+class TransientAPIError(RuntimeError):
+    """Falha transitória reportada no corpo da resposta (ex.: OVER_QUERY_LIMIT); vale nova tentativa"""
+
 
 class RateLimiter:
-    """Controla rate limits por API"""
+    """Controla rate limits por API (token bucket sobre relógio monotônico)"""
     
     def __init__(self, max_per_minute: int = 60):
         self.max_per_minute = max_per_minute
-        self.calls = []
+        self.rate = max_per_minute / 60.0  # tokens repostos por segundo
+        self.tokens = float(max_per_minute)
+        self.last_refill = time.monotonic()
         self._lock = asyncio.Lock()
     
+    def _available_tokens(self, now: float) -> float:
+        """Tokens disponíveis em now, sem exceder a capacidade"""
+        return min(self.max_per_minute, self.tokens + (now - self.last_refill) * self.rate)
+    
+    @property
+    def current_calls(self) -> int:
+        """Chamadas ainda contabilizadas na janela (capacidade consumida do bucket)"""
+        return round(self.max_per_minute - self._available_tokens(time.monotonic()))
+    
     async def wait_if_needed(self):
         """Espera se necessário para respeitar rate limit"""
         async with self._lock:
-            now = datetime.now()
-            # Remove chamadas antigas (> 1 minuto)
-            self.calls = [call for call in self.calls if now - call < timedelta(minutes=1)]
-            
-            if len(self.calls) >= self.max_per_minute:
-                # Calcula tempo de espera
-                oldest_call = min(self.calls)
-                wait_time = 60 - (now - oldest_call).total_seconds()
-                if wait_time > 0:
-                    logger.warning(f"⏳ Rate limit atingido. Aguardando {wait_time:.1f}s...")
-                    await asyncio.sleep(wait_time)
-                    # Limpa lista após esperar
-                    self.calls = []
+            now = time.monotonic()
+            self.tokens = self._available_tokens(now)
+            self.last_refill = now
+            
+            if self.tokens < 1.0:
+                # Espera só o tempo de repor um token
+                wait_time = (1.0 - self.tokens) / self.rate
+                logger.warning("⏳ Rate limit atingido. Aguardando %.1fs...", wait_time)
+                await asyncio.sleep(wait_time)
+                
+                now = time.monotonic()
+                self.tokens = self._available_tokens(now)
+                self.last_refill = now
             
             # Registra nova chamada
-            self.calls.append(now)
+            self.tokens -= 1.0
+
+
+class ResponseCache:
+    """Cache em memória com stale-while-revalidate para respostas de APIs idempotentes"""
+    
+    def __init__(self, ttl: float = 120, stale_ttl: float = 600, max_entries: int = 4096):
+        self.ttl = ttl              # segundos em que a resposta é servida como fresca
+        self.stale_ttl = stale_ttl  # segundos até descartar (servida velha e revalidada)
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+    
+    @staticmethod
+    def make_key(api_name: str, params: Dict[str, Any]) -> str:
+        """Chave estável para a chamada (API + parâmetros)"""
+        payload = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.blake2b(f"{api_name}:{payload}".encode(), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Retorna (cópia do valor, fresco?); valor None se ausente ou expirado"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, False
+        
+        expires_at, stale_until, value = entry
+        now = time.monotonic()
+        if now >= stale_until:
+            del self._entries[key]
+            return None, False
+        
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value), now < expires_at
+    
+    def set(self, key: str, value: Any):
+        """Armazena valor, descartando os menos usados recentemente acima do limite"""
+        now = time.monotonic()
+        self._entries[key] = (now + self.ttl, now + self.stale_ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
 
 
 class APIManager:
     """Gerencia todas as APIs externas do sistema"""
     
     def __init__(self):
+        self.api_keys = _load_api_keys()
         self.apis = {}
         self.rate_limiters = {}
+        self.semaphores = {}
+        
+        # Novas tentativas em erros transitórios (backoff exponencial com jitter);
+        # initialize() aplica API_RETRY_ATTEMPTS / API_RETRY_DELAY
+        self.retry_attempts = 3
+        self.retry_delay = 2.0
+        self.response_cache = ResponseCache()
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}  # Revalidações em andamento por chave
+        self.llm_clients = {}  # Clientes assíncronos dos SDKs de LLM, criados uma vez
+        self._apify_actors: Dict[str, Any] = {}  # Objetos de actor do Apify por actor_id
+        self._gmaps_client = None  # Cliente do SDK googlemaps, criado no primeiro get_api('google_maps')
         self.session = None
+        self._executor = None  # Pool dedicado às chamadas síncronas de SDK
         self.is_initialized = False
         
     async def initialize(self):
@@ -67,108 +189,198 @@ class APIManager:
             
         logger.info("🚀 Inicializando APIs...")
         
-        # Criar sessão aiohttp
+        # Uma única leitura do ambiente para toda a inicialização
+        env = dict(os.environ)
+        keys = self.api_keys
+        maps_key = keys.get('GOOGLE_MAPS_API_KEY')
+        openai_key = keys.get('OPENAI_API_KEY')
+        anthropic_key = keys.get('ANTHROPIC_API_KEY')
+        gemini_key = keys.get('GOOGLE_AI_API_KEY')
+        deepseek_key = keys.get('DEEPSEEK_API_KEY')
+        cse_key, cse_cx = keys.get('GOOGLE_CSE_API_KEY'), keys.get('GOOGLE_CSE_CX')
+        apify_token = keys.get('APIFY_API_TOKEN')
+        
+        self.retry_attempts = max(1, int(env.get('API_RETRY_ATTEMPTS', self.retry_attempts)))
+        self.retry_delay = float(env.get('API_RETRY_DELAY', self.retry_delay))
+        
+        # Criar sessão aiohttp compartilhada, com pool de conexões e cache de DNS
+        connector = aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=75
+        )
         self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30, connect=5, sock_read=25),
             headers={'User-Agent': 'AURA-NEXUS/1.0'}
         )
         
-        # Google Maps
-        if os.getenv('GOOGLE_MAPS_API_KEY'):
-            self.apis['google_maps'] = googlemaps.Client(
-                key=os.getenv('GOOGLE_MAPS_API_KEY')
-            )
+        # Pool limitado para SDKs síncronos (chamadas de I/O, poucas threads bastam)
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(env.get('API_SDK_WORKERS', 10)),
+            thread_name_prefix='aura-sdk'
+        )
+        
+        # Google Maps (buscas pela REST API; o cliente googlemaps só é criado sob demanda em get_api)
+        if maps_key:
+            self.apis['google_maps'] = {'api_key': maps_key}
             self.rate_limiters['google_maps'] = RateLimiter(
-                int(os.getenv('GOOGLE_MAPS_RPM', 60))
+                int(env.get('GOOGLE_MAPS_RPM', 60))
             )
             logger.info("✅ Google Maps API configurada")
         
         # OpenAI
-        if os.getenv('OPENAI_API_KEY'):
-            openai.api_key = os.getenv('OPENAI_API_KEY')
+        if openai_key:
+            import openai
+            from openai import AsyncOpenAI
+            
+            openai.api_key = openai_key
             self.apis['openai'] = openai
+            self.llm_clients['openai'] = AsyncOpenAI(
+                api_key=openai_key,
+                max_retries=self.retry_attempts - 1
+            )
             self.rate_limiters['openai'] = RateLimiter(
-                int(os.getenv('OPENAI_RPM', 50))
+                int(env.get('OPENAI_RPM', 50))
             )
             logger.info("✅ OpenAI API configurada")
         
         # Anthropic Claude
-        if os.getenv('ANTHROPIC_API_KEY'):
+        if anthropic_key:
+            from anthropic import Anthropic, AsyncAnthropic
+            
             self.apis['anthropic'] = Anthropic(
-                api_key=os.getenv('ANTHROPIC_API_KEY')
+                api_key=anthropic_key
+            )
+            self.llm_clients['anthropic'] = AsyncAnthropic(
+                api_key=anthropic_key,
+                max_retries=self.retry_attempts - 1
             )
             self.rate_limiters['anthropic'] = RateLimiter(
-                int(os.getenv('ANTHROPIC_RPM', 40))
+                int(env.get('ANTHROPIC_RPM', 40))
             )
             logger.info("✅ Anthropic API configurada")
         
         # Google Gemini
-        if os.getenv('GOOGLE_AI_API_KEY'):
-            genai.configure(api_key=os.getenv('GOOGLE_AI_API_KEY'))
+        if gemini_key:
+            import google.generativeai as genai
+            
+            genai.configure(api_key=gemini_key)
             self.apis['gemini'] = genai
             self.rate_limiters['gemini'] = RateLimiter(50)
             logger.info("✅ Google Gemini API configurada")
             
         # DeepSeek
-        if os.getenv('DEEPSEEK_API_KEY'):
+        if deepseek_key:
+            from openai import AsyncOpenAI
+            
             self.apis['deepseek'] = {
-                'api_key': os.getenv('DEEPSEEK_API_KEY'),
+                'api_key': deepseek_key,
                 'base_url': 'https://api.deepseek.com/v1'
             }
+            self.llm_clients['deepseek'] = AsyncOpenAI(
+                api_key=deepseek_key,
+                base_url='https://api.deepseek.com/v1',
+                max_retries=self.retry_attempts - 1
+            )
             self.rate_limiters['deepseek'] = RateLimiter(60)
             logger.info("✅ DeepSeek API configurada")
         
         # Google Custom Search
-        if os.getenv('GOOGLE_CSE_API_KEY') and os.getenv('GOOGLE_CSE_CX'):
+        if cse_key and cse_cx:
             self.apis['google_cse'] = {
-                'api_key': os.getenv('GOOGLE_CSE_API_KEY'),
-                'cx': os.getenv('GOOGLE_CSE_CX')
+                'api_key': cse_key,
+                'cx': cse_cx,
+                'base_url': yarl.URL('https://www.googleapis.com/customsearch/v1').with_query(
+                    key=cse_key,
+                    cx=cse_cx,
+                    hl='pt-BR',
+                    gl='br'
+                )
             }
             self.rate_limiters['google_cse'] = RateLimiter(
-                int(os.getenv('GOOGLE_CSE_RPM', 100))
+                int(env.get('GOOGLE_CSE_RPM', 100))
             )
             logger.info("✅ Google Custom Search API configurada")
         
         # Apify
-        if os.getenv('APIFY_API_TOKEN'):
+        if apify_token:
+            apify_config = {
+                'token': apify_token,
+                'instagram_actor': env.get('APIFY_INSTAGRAM_ACTOR_ID', 'apify/instagram-profile-scraper'),
+                'facebook_actor': env.get('APIFY_FACEBOOK_ACTOR_ID', 'curious_coder/facebook-profile-scraper'),
+                'linkedin_actor': env.get('APIFY_LINKEDIN_ACTOR_ID', 'apify/linkedin-profile-scraper')
+            }
             try:
                 from apify_client import ApifyClient
                 
                 # Create main Apify client
-                apify_client = ApifyClient(os.getenv('APIFY_API_TOKEN'))
-                
-                self.apis['apify'] = {
-                    'client': apify_client,
-                    'token': os.getenv('APIFY_API_TOKEN'),
-                    'instagram_actor': os.getenv('APIFY_INSTAGRAM_ACTOR_ID', 'apify/instagram-profile-scraper'),
-                    'facebook_actor': os.getenv('APIFY_FACEBOOK_ACTOR_ID', 'curious_coder/facebook-profile-scraper'),
-                    'linkedin_actor': os.getenv('APIFY_LINKEDIN_ACTOR_ID', 'apify/linkedin-profile-scraper')
-                }
-                self.rate_limiters['apify'] = RateLimiter(30)
+                self.apis['apify'] = {'client': ApifyClient(apify_token), **apify_config}
                 logger.info("✅ Apify API configurada com cliente")
             except ImportError:
                 logger.warning("⚠️ apify-client não encontrado. Instale com: pip install apify-client")
-                self.apis['apify'] = {
-                    'token': os.getenv('APIFY_API_TOKEN'),
-                    'instagram_actor': os.getenv('APIFY_INSTAGRAM_ACTOR_ID', 'apify/instagram-profile-scraper'),
-                    'facebook_actor': os.getenv('APIFY_FACEBOOK_ACTOR_ID', 'curious_coder/facebook-profile-scraper'),
-                    'client': None
-                }
-                self.rate_limiters['apify'] = RateLimiter(30)
+                self.apis['apify'] = {'client': None, **apify_config}
                 logger.info("✅ Apify API configurada (sem cliente)")
+            self.rate_limiters['apify'] = RateLimiter(30)
+        
+        # Limite de requisições simultâneas por API (ajustável via <API>_CONCURRENCY, ex.: OPENAI_CONCURRENCY)
+        self.semaphores = {
+            api_name: asyncio.Semaphore(int(env.get(f'{api_name.upper()}_CONCURRENCY', 5)))
+            for api_name in self.rate_limiters
+        }
+        
+        # Pré-conectar aos hosts usados pela sessão aiohttp (opcional: gera tráfego de rede, ligar com API_WARMUP=1)
+        if env.get('API_WARMUP', '0') == '1':
+            await self._warm_up_connections()
         
         self.is_initialized = True
-        logger.info(f"✅ {len(self.apis)} APIs inicializadas com sucesso!")
+        logger.info("✅ %s APIs inicializadas com sucesso!", len(self.apis))
+    
+    async def _warm_up_connections(self):
+        """Resolve DNS e abre conexões keep-alive com os hosts das APIs configuradas"""
+        hosts = [host for api_name, host in _SESSION_HOSTS.items() if api_name in self.apis]
+        if not hosts:
+            return
+        
+        async def warm(host: str):
+            async with self.session.head(f"https://{host}/", timeout=aiohttp.ClientTimeout(total=3)):
+                pass
+        
+        # Falhas aqui não impedem a inicialização; a primeira chamada real só pagará a conexão
+        results = await asyncio.gather(*(warm(host) for host in hosts), return_exceptions=True)
+        warmed = sum(not isinstance(result, Exception) for result in results)
+        logger.debug("🔌 %s/%s hosts pré-conectados", warmed, len(hosts))
     
     async def close(self):
         """Fecha conexões abertas"""
+        for task in list(self._refresh_tasks.values()):
+            task.cancel()
+        
+        for client in self.llm_clients.values():
+            await client.close()
+        self.llm_clients.clear()
+        
         if self.session:
             await self.session.close()
+            # Dá tempo ao connector para encerrar as conexões SSL
+            await asyncio.sleep(0.25)
+        
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
     
     def get_api(self, api_name: str) -> Any:
         """Retorna cliente da API solicitada"""
         if api_name not in self.apis:
             raise ValueError(f"API '{api_name}' não configurada")
+        
+        if api_name == 'google_maps':
+            if self._gmaps_client is None:
+                import googlemaps
+                self._gmaps_client = googlemaps.Client(key=self.apis['google_maps']['api_key'])
+            return self._gmaps_client
+        
         return self.apis[api_name]
     
     def get_client(self, client_name: str) -> Any:
@@ -179,27 +391,103 @@ class APIManager:
             return self.apis['apify'].get('client')  # Use same client for now
         return None
     
-    async def call_with_rate_limit(self, api_name: str, func, *args, **kwargs):
-        """Executa chamada respeitando rate limit"""
+    async def call_sync_with_rate_limit(self, api_name: str, fn: Callable, *args, **kwargs):
+        """Executa função síncrona (SDK) no pool de threads respeitando rate limit"""
         if api_name not in self.rate_limiters:
             # Se não tem rate limiter, executa direto
-            return await self._execute_async(func, *args, **kwargs)
+            return await self._run_sync(fn, *args, **kwargs)
         
-        # Espera se necessário
-        await self.rate_limiters[api_name].wait_if_needed()
+        # Espera vaga e rate limit, depois executa
+        async with self._api_slot(api_name):
+            return await self._run_sync(fn, *args, **kwargs)
+    
+    async def call_async_with_rate_limit(self, api_name: str, coro: Awaitable):
+        """Aguarda a corrotina respeitando rate limit"""
+        if api_name not in self.rate_limiters:
+            return await coro
+        
+        async with self._api_slot(api_name):
+            return await coro
+    
+    async def call_with_rate_limit(self, api_name: str, func, *args, **kwargs):
+        """Executa chamada respeitando rate limit (legado: prefira as variantes sync/async)"""
+        if asyncio.iscoroutinefunction(func):
+            return await self.call_async_with_rate_limit(api_name, func(*args, **kwargs))
+        return await self.call_sync_with_rate_limit(api_name, func, *args, **kwargs)
+    
+    @contextlib.asynccontextmanager
+    async def _api_slot(self, api_name: str):
+        """Reserva uma vaga de concorrência da API e respeita seu rate limit"""
+        async with self.semaphores[api_name]:
+            await self.rate_limiters[api_name].wait_if_needed()
+            yield
+    
+    async def _cached_call(self,
+                           api_name: str,
+                           params: Dict[str, Any],
+                           fetch: Callable[[], Awaitable[Optional[Any]]]) -> Optional[Any]:
+        """Serve resposta do cache (velha é revalidada em background); busca em caso de miss.
+        
+        fetch retorna None em falhas, que nunca são armazenadas.
+        """
+        key = ResponseCache.make_key(api_name, params)
+        value, fresh = self.response_cache.get(key)
+        if value is not None:
+            if not fresh and key not in self._refresh_tasks:
+                self._refresh_tasks[key] = asyncio.create_task(self._refresh_cached(key, fetch))
+            return value
+        
+        value = await fetch()
+        if value is not None:
+            self.response_cache.set(key, value)
+        return value
+    
+    async def _refresh_cached(self, key: str, fetch: Callable[[], Awaitable[Optional[Any]]]):
+        """Revalida uma entrada velha do cache"""
+        try:
+            value = await fetch()
+            if value is not None:
+                self.response_cache.set(key, value)
+        except Exception as e:
+            logger.warning("⚠️ Falha ao revalidar cache: %s", e)
+        finally:
+            self._refresh_tasks.pop(key, None)
+    
+    async def _with_retry(self, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Repete request em erros transitórios (429/5xx, timeout, conexão, TransientAPIError) com backoff e jitter.
+        
+        Cada tentativa passa de novo pelo semáforo e rate limit da API, contando no orçamento.
+        """
+        for attempt in range(self.retry_attempts):
+            try:
+                return await request()
+            except (aiohttp.ClientResponseError, aiohttp.ClientConnectionError, asyncio.TimeoutError, TransientAPIError) as e:
+                is_response_error = isinstance(e, aiohttp.ClientResponseError)
+                if (is_response_error and e.status not in _RETRYABLE_STATUSES) or attempt == self.retry_attempts - 1:
+                    raise
+                
+                # Respeita Retry-After (em segundos); senão backoff exponencial com jitter completo
+                retry_after = e.headers.get('Retry-After', '') if is_response_error and e.headers else ''
+                if retry_after.isdigit():
+                    delay = float(retry_after)
+                else:
+                    delay = random.uniform(0, self.retry_delay * 2 ** attempt)
+                
+                logger.warning("🔁 Erro transitório (%r). Nova tentativa %s/%s em %.1fs", e, attempt + 2, self.retry_attempts, delay)
+                await asyncio.sleep(delay)
         
-        # Executa
-        return await self._execute_async(func, *args, **kwargs)
+        raise RuntimeError(f"retry_attempts deve ser >= 1 (recebido {self.retry_attempts})")
+    
+    async def _run_sync(self, fn: Callable, *args, **kwargs):
+        """Executa função síncrona no pool dedicado (ou no padrão antes de initialize)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
     
     async def _execute_async(self, func, *args, **kwargs):
-        """Executa função de forma assíncrona"""
-        # Se a função já é assíncrona
+        """Executa função de forma assíncrona (legado, mantido para chamadores externos)"""
         if asyncio.iscoroutinefunction(func):
             return await func(*args, **kwargs)
-        
-        # Se é síncrona, executa em thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, func, *args, **kwargs)
+        return await self._run_sync(func, *args, **kwargs)
     
     # === APIs Específicas ===
     
@@ -210,16 +498,15 @@ class APIManager:
             return None
         
         try:
-            gmaps = self.apis['google_maps']
-            
-            # Buscar lugar
-            result = await self.call_with_rate_limit(
-                'google_maps',
-                lambda: gmaps.places(
-                    query=query,
-                    language='pt-BR',
-                    region='br'
-                )
+            # Buscar lugar (consultas repetidas vêm do cache)
+            result = await self._cached_call(
+                'google_maps_places',
+                {'query': query},
+                lambda: self._with_retry(lambda: self._fetch_google_maps('textsearch', {
+                    'query': query,
+                    'language': 'pt-BR',
+                    'region': 'br'
+                }))
             )
             
             if result['results']:
@@ -228,7 +515,7 @@ class APIManager:
             return None
             
         except Exception as e:
-            logger.error(f"❌ Erro ao buscar no Google Maps: {e}")
+            logger.error("❌ Erro ao buscar no Google Maps: %s", e)
             return None
     
     async def get_place_details(self, place_id: str) -> Optional[Dict]:
@@ -237,27 +524,38 @@ class APIManager:
             return None
         
         try:
-            gmaps = self.apis['google_maps']
-            
-            result = await self.call_with_rate_limit(
-                'google_maps',
-                lambda: gmaps.place(
-                    place_id=place_id,
-                    language='pt-BR',
-                    fields=[
-                        'name', 'formatted_address', 'formatted_phone_number',
-                        'website', 'rating', 'user_ratings_total', 'opening_hours',
-                        'photo', 'type', 'geometry', 'business_status'
-                    ]
-                )
+            result = await self._cached_call(
+                'google_maps_place',
+                {'place_id': place_id},
+                lambda: self._with_retry(lambda: self._fetch_google_maps('details', {
+                    'place_id': place_id,
+                    'language': 'pt-BR',
+                    'fields': _PLACE_DETAILS_FIELDS
+                }))
             )
             
             return result.get('result')
             
         except Exception as e:
-            logger.error(f"❌ Erro ao obter detalhes do lugar: {e}")
+            logger.error("❌ Erro ao obter detalhes do lugar: %s", e)
             return None
     
+    async def _fetch_google_maps(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Chama a Places REST API pela sessão compartilhada; erro se o status não for OK/ZERO_RESULTS"""
+        url = f"https://maps.googleapis.com/maps/api/place/{endpoint}/json"
+        
+        async with self._api_slot('google_maps'):
+            async with self.session.get(url, params={**params, 'key': self.api_keys['GOOGLE_MAPS_API_KEY']}) as response:
+                response.raise_for_status()
+                data = _json_loads(await response.read())
+        
+        status = data.get('status')
+        if status in _RETRYABLE_MAPS_STATUSES:
+            raise TransientAPIError(f"Google Maps {status}: {data.get('error_message', '')}")
+        if status not in ('OK', 'ZERO_RESULTS'):
+            raise RuntimeError(f"Google Maps {status}: {data.get('error_message', '')}")
+        return data
+    
     async def search_google_cse(self, query: str, num: int = 10) -> List[Dict]:
         """Busca usando Google Custom Search"""
         if 'google_cse' not in self.apis:
@@ -265,58 +563,51 @@ class APIManager:
             return []
         
         try:
-            cse = self.apis['google_cse']
-            url = "https://www.googleapis.com/customsearch/v1"
-            
-            params = {
-                'key': cse['api_key'],
-                'cx': cse['cx'],
-                'q': query,
-                'num': num,
-                'hl': 'pt-BR',
-                'gl': 'br'
-            }
-            
-            # Rate limit
-            await self.rate_limiters['google_cse'].wait_if_needed()
-            
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get('items', [])
-                else:
-                    logger.error(f"❌ Google CSE erro: {response.status}")
-                    return []
+            # Só q e num variam; os parâmetros fixos já estão codificados na URL base
+            url = self.apis['google_cse']['base_url'].update_query(q=query, num=num)
+            
+            # Consultas repetidas vêm do cache; respostas com erro não são armazenadas
+            items = await self._cached_call(
+                'google_cse',
+                {'q': query, 'num': num},
+                lambda: self._with_retry(lambda: self._fetch_google_cse(url))
+            )
+            return items if items is not None else []
                     
         except Exception as e:
-            logger.error(f"❌ Erro no Google CSE: {e}")
+            logger.error("❌ Erro no Google CSE: %s", e)
             return []
     
+    async def _fetch_google_cse(self, url: yarl.URL) -> Optional[List[Dict]]:
+        """Executa a busca no Google CSE; None em caso de erro HTTP"""
+        async with self._api_slot('google_cse'):
+            async with self.session.get(url) as response:
+                if response.status == 200:
+                    data = _json_loads(await response.read())
+                    return data.get('items', [])
+                elif response.status in _RETRYABLE_STATUSES:
+                    response.raise_for_status()
+                else:
+                    logger.error("❌ Google CSE erro: %s", response.status)
+                    return None
+    
     async def complete_openai(self, prompt: str, model: str = "gpt-3.5-turbo", **kwargs) -> Optional[str]:
         """Gera texto usando OpenAI"""
         if 'openai' not in self.apis:
             return None
         
         try:
-            await self.rate_limiters['openai'].wait_if_needed()
-            
-            # Criar cliente OpenAI
-            from openai import OpenAI
-            client = OpenAI(api_key=openai.api_key)
-            
-            # Executar chamada
-            completion = await self._execute_async(
-                lambda: client.chat.completions.create(
+            async with self._api_slot('openai'):
+                completion = await self.llm_clients['openai'].chat.completions.create(
                     model=model,
                     messages=[{"role": "user", "content": prompt}],
                     **kwargs
                 )
-            )
             
             return completion.choices[0].message.content
             
         except Exception as e:
-            logger.error(f"❌ Erro OpenAI: {e}")
+            logger.error("❌ Erro OpenAI: %s", e)
             return None
     
     async def complete_anthropic(self, prompt: str, model: str = "claude-3-haiku-20240307", **kwargs) -> Optional[str]:
@@ -325,21 +616,17 @@ class APIManager:
             return None
         
         try:
-            await self.rate_limiters['anthropic'].wait_if_needed()
-            
-            client = self.apis['anthropic']
-            response = await self._execute_async(
-                client.messages.create,
-                model=model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1000,
-                **kwargs
-            )
+            async with self._api_slot('anthropic'):
+                response = await self.llm_clients['anthropic'].messages.create(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    **{**_ANTHROPIC_REQUEST_DEFAULTS, **kwargs}
+                )
             
             return response.content[0].text
             
         except Exception as e:
-            logger.error(f"❌ Erro Anthropic: {e}")
+            logger.error("❌ Erro Anthropic: %s", e)
             return None
     
     async def complete_gemini(self, prompt: str, model_name: str = "gemini-pro", **kwargs) -> Optional[str]:
@@ -348,18 +635,14 @@ class APIManager:
             return None
         
         try:
-            await self.rate_limiters['gemini'].wait_if_needed()
-            
-            model = genai.GenerativeModel(model_name)
-            response = await self._execute_async(
-                model.generate_content,
-                prompt
-            )
+            async with self._api_slot('gemini'):
+                model = self.apis['gemini'].GenerativeModel(model_name)
+                response = await model.generate_content_async(prompt)
             
             return response.text
             
         except Exception as e:
-            logger.error(f"❌ Erro Gemini: {e}")
+            logger.error("❌ Erro Gemini: %s", e)
             return None
             
     async def complete_deepseek(self, prompt: str, model: str = "deepseek-chat", **kwargs) -> Optional[str]:
@@ -368,50 +651,124 @@ class APIManager:
             return None
         
         try:
-            await self.rate_limiters['deepseek'].wait_if_needed()
-            
-            deepseek_config = self.apis['deepseek']
-            
-            # Use OpenAI client with DeepSeek endpoint
-            from openai import OpenAI
-            client = OpenAI(
-                api_key=deepseek_config['api_key'],
-                base_url=deepseek_config['base_url']
-            )
-            
-            completion = await self._execute_async(
-                lambda: client.chat.completions.create(
+            async with self._api_slot('deepseek'):
+                # Cliente OpenAI assíncrono apontando para o endpoint DeepSeek
+                completion = await self.llm_clients['deepseek'].chat.completions.create(
                     model=model,
                     messages=[{"role": "user", "content": prompt}],
                     **kwargs
                 )
-            )
             
             return completion.choices[0].message.content
             
         except Exception as e:
-            logger.error(f"❌ Erro DeepSeek: {e}")
+            logger.error("❌ Erro DeepSeek: %s", e)
             return None
     
+    async def complete_ensemble(self,
+                                prompt: str,
+                                providers: Optional[List[str]] = None,
+                                timeout: Optional[float] = None) -> Dict[str, Optional[str]]:
+        """
+        Gera texto em vários provedores de LLM em paralelo
+        
+        Args:
+            prompt: Prompt enviado a todos os provedores
+            providers: Provedores a consultar (padrão: todos os configurados)
+            timeout: Tempo máximo em segundos; provedores atrasados são cancelados
+            
+        Returns:
+            Resposta por provedor (None em caso de falha ou timeout)
+        """
+        tasks = self._start_completions(prompt, providers)
+        if not tasks:
+            return {}
+        
+        done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning("⏳ %s LLM(s) sem resposta em %ss foram canceladas", len(pending), timeout)
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        return {
+            provider: task.result() if task in done else None
+            for provider, task in tasks.items()
+        }
+    
+    async def complete_first_successful(self,
+                                        prompt: str,
+                                        providers: Optional[List[str]] = None,
+                                        timeout: Optional[float] = None) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Gera texto em vários provedores em paralelo e fica com a primeira resposta válida
+        
+        As demais chamadas são canceladas assim que uma resposta chega, então a latência
+        é a do provedor mais rápido que responder com sucesso.
+        
+        Returns:
+            (provedor, resposta), ou (None, None) se nenhum responder dentro de timeout
+        """
+        tasks = self._start_completions(prompt, providers)
+        provider_by_task = {task: provider for provider, task in tasks.items()}
+        pending = set(tasks.values())
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        try:
+            while pending:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    logger.warning("⏳ Nenhuma LLM respondeu em %ss", timeout)
+                    break
+                
+                for task in done:
+                    response = task.result()
+                    if response:
+                        return provider_by_task[task], response
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        return None, None
+    
+    def _start_completions(self, prompt: str, providers: Optional[List[str]]) -> Dict[str, asyncio.Task]:
+        """Dispara complete_<provedor> para cada provedor (padrão: todos os configurados)"""
+        if providers is None:
+            providers = [provider for provider in _LLM_PROVIDERS if provider in self.apis]
+        
+        unsupported = set(providers).difference(_LLM_PROVIDERS)
+        if unsupported:
+            raise ValueError(f"LLM não suportada: {', '.join(sorted(unsupported))}")
+        
+        # Cada chamada continua limitada pelo semáforo e rate limit do seu provedor
+        return {
+            provider: asyncio.create_task(getattr(self, f"complete_{provider}")(prompt))
+            for provider in providers
+        }
+    
     def get_available_apis(self) -> List[str]:
         """Retorna lista de APIs disponíveis"""
         return list(self.apis.keys())
     
     def get_api_status(self) -> Dict[str, Any]:
-        """Retorna status das APIs"""
-        status = {
+        """Retorna status das APIs (o uso atual é calculado em O(1) por rate limiter)"""
+        return {
             'initialized': self.is_initialized,
             'available_apis': self.get_available_apis(),
-            'rate_limits': {}
-        }
-        
-        for api_name, limiter in self.rate_limiters.items():
-            status['rate_limits'][api_name] = {
-                'max_per_minute': limiter.max_per_minute,
-                'current_calls': len(limiter.calls)
+            'rate_limits': {
+                api_name: {
+                    'max_per_minute': limiter.max_per_minute,
+                    'current_calls': limiter.current_calls
+                }
+                for api_name, limiter in self.rate_limiters.items()
             }
-        
-        return status
+        }
     
     async def scrape_with_apify(self, actor_id: str, run_input: Dict[str, Any], timeout: int = 120) -> Optional[List[Dict]]:
         """Executa scraping usando Apify Actor"""
@@ -420,25 +777,51 @@ class APIManager:
             return None
         
         try:
-            await self.rate_limiters['apify'].wait_if_needed()
+            items = [item async for item in self.iter_apify_items(actor_id, run_input, timeout)]
             
-            client = self.apis['apify']['client']
-            
-            # Execute actor
-            run = await self._execute_async(
-                client.actor(actor_id).call,
-                run_input=run_input,
-                timeout_secs=timeout
-            )
-            
-            # Get results
-            items = await self._execute_async(
-                lambda: list(client.dataset(run["defaultDatasetId"]).iterate_items())
-            )
-            
-            logger.info(f"✅ Apify scraping completado: {len(items)} itens")
+            logger.info("✅ Apify scraping completado: %s itens", len(items))
             return items
             
         except Exception as e:
-            logger.error(f"❌ Erro no scraping Apify: {e}")
-            return None
\ No newline at end of file
+            logger.error("❌ Erro no scraping Apify: %s", e)
+            return None
+    
+    async def iter_apify_items(self,
+                               actor_id: str,
+                               run_input: Dict[str, Any],
+                               timeout: int = 120,
+                               page_size: int = 500) -> AsyncIterator[Dict]:
+        """
+        Executa um Actor do Apify e entrega os itens do dataset conforme as páginas chegam
+        
+        Permite processar os primeiros itens enquanto o restante é baixado, sem manter o
+        dataset inteiro em memória. Erros são propagados ao chamador.
+        """
+        if 'apify' not in self.apis or not self.apis['apify'].get('client'):
+            logger.warning("⚠️ Cliente Apify não disponível")
+            return
+        
+        client = self.apis['apify']['client']
+        actor = self._apify_actors.get(actor_id)
+        if actor is None:
+            actor = self._apify_actors[actor_id] = client.actor(actor_id)
+        
+        # Execute actor
+        run = await self.call_sync_with_rate_limit(
+            'apify',
+            actor.call,
+            run_input=run_input,
+            timeout_secs=timeout
+        )
+        
+        # Paginar resultados
+        dataset = client.dataset(run["defaultDatasetId"])
+        offset = 0
+        while True:
+            page = await self._run_sync(dataset.list_items, offset=offset, limit=page_size)
+            if not page.items:
+                return
+            
+            for item in page.items:
+                yield item
+            offset += len(page.items)
@@ -4,6 +4,7 @@ AURA NEXUS v24.4 - CÉLULA 10 v2: PROCESSADOR DE LEADS MELHORADO
 Suporte para modos de análise: basic vs full_strategy
 """
 import asyncio
+import bisect
 import logging
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
@@ -11,11 +12,26 @@ import json
 import os
 from typing import Dict, Any, Optional
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from ..features.social_scraping import SocialMediaScraper
 
 logger = logging.getLogger("AURA_NEXUS.LeadProcessor")
 
+# Pontos do score básico por canal de contato preenchido
+_CONTACT_SCORE_FIELDS = ('gdr_telefone_1', 'gdr_whatsapp', 'gdr_website')
+_CONTACT_SCORE_POINTS = (5, 10, 10)
+_CONTACT_SCORE_WEIGHTS = np.array(_CONTACT_SCORE_POINTS, dtype=np.int64)
+
+# Faixas de categoria do score: limites inferiores de cada categoria acima de 'Fraco'
+_SCORE_CATEGORY_BOUNDS = (40, 55, 70, 85)
+_SCORE_CATEGORY_LABELS = ('Fraco', 'Regular', 'Bom', 'Muito Bom', 'Excelente')
+
+# Fontes de dados consideradas no score de confiança
+_CONFIDENCE_SOURCE_FIELDS = (
+    'gdr_rating_google', 'gdr_url_instagram', 'gdr_url_facebook', 'gdr_website', 'gdr_cse_results'
+)
+
 # ===================================================================================
 # CLASSE: LeadProcessor V2
 # ===================================================================================
@@ -1008,17 +1024,55 @@ class LeadProcessor:
             score += 5
         
         # Contatos
-        if self.gdr.get('gdr_telefone_1'):
-            score += 5
-        if self.gdr.get('gdr_whatsapp'):
-            score += 10
-        if self.gdr.get('gdr_website'):
-            score += 10
+        for field, points in zip(_CONTACT_SCORE_FIELDS, _CONTACT_SCORE_POINTS):
+            if self.gdr.get(field):
+                score += points
         
         self.gdr['gdr_score'] = min(score, 100)
         self.gdr['gdr_score_categoria'] = self._get_score_category(score)
         self.gdr['gdr_motivo_score'] = 'Score básico baseado em dados públicos'
     
+    @staticmethod
+    def calculate_basic_scores_batch(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcula o score básico de vários leads de uma vez (versão vetorizada de _calculate_basic_score)
+        
+        Args:
+            df: DataFrame com colunas gdr_* (colunas ausentes contam como vazias)
+            
+        Returns:
+            DataFrame com gdr_score e gdr_score_categoria, no mesmo índice de df
+        """
+        def numeric(column: str) -> np.ndarray:
+            if column not in df:
+                return np.zeros(len(df))
+            return pd.to_numeric(df[column], errors='coerce').fillna(0).to_numpy()
+        
+        def filled(column: str) -> np.ndarray:
+            # Mesma regra do cálculo por lead: valor "verdadeiro" em Python ('' , 0 e False não contam)
+            if column not in df:
+                return np.zeros(len(df), dtype=np.int8)
+            return np.fromiter(map(bool, df[column]), dtype=np.int8, count=len(df))
+        
+        rating = numeric('gdr_rating_google')
+        reviews = numeric('gdr_total_reviews_google')
+        
+        score = (
+            50
+            + np.select([rating >= 4.5, rating >= 4, rating >= 3.5], [20, 10, 5], 0)
+            + np.select([reviews > 100, reviews > 50, reviews > 10], [15, 10, 5], 0)
+            + np.column_stack([filled(field) for field in _CONTACT_SCORE_FIELDS]) @ _CONTACT_SCORE_WEIGHTS
+        )
+        
+        categories = np.asarray(_SCORE_CATEGORY_LABELS, dtype=object)[
+            np.searchsorted(_SCORE_CATEGORY_BOUNDS, score, side='right')
+        ]
+        
+        return pd.DataFrame({
+            'gdr_score': np.minimum(score, 100),
+            'gdr_score_categoria': categories
+        }, index=df.index)
+    
     async def _calculate_advanced_score(self):
         """Calcula score avançado (modo FULL)"""
         if self.scoring_system:
@@ -1044,16 +1098,7 @@ class LeadProcessor:
     
     def _get_score_category(self, score: float) -> str:
         """Retorna categoria baseada no score"""
-        if score >= 85:
-            return 'Excelente'
-        elif score >= 70:
-            return 'Muito Bom'
-        elif score >= 55:
-            return 'Bom'
-        elif score >= 40:
-            return 'Regular'
-        else:
-            return 'Fraco'
+        return _SCORE_CATEGORY_LABELS[bisect.bisect_right(_SCORE_CATEGORY_BOUNDS, score)]
     
     async def _extract_contacts_from_content(self, content: str):
         """Extrai contatos adicionais de conteúdo"""
@@ -1082,22 +1127,17 @@ class LeadProcessor:
         """Calcula métricas avançadas para modo premium"""
         try:
             # Completude dos dados
-            total_fields = len([k for k in self.gdr.keys() if k.startswith('gdr_')])
-            filled_fields = len([k for k, v in self.gdr.items() if k.startswith('gdr_') and v])
+            gdr_values = [v for k, v in self.gdr.items() if k.startswith('gdr_')]
+            total_fields = len(gdr_values)
+            filled_fields = sum(map(bool, gdr_values))
             self.gdr['gdr_data_completeness'] = round((filled_fields / total_fields * 100), 2) if total_fields > 0 else 0
             
             # Score de confiança geral
             confidence_factors = []
             
             # Fator 1: Múltiplas fontes de dados
-            sources_count = sum([
-                1 if self.gdr.get('gdr_rating_google') else 0,
-                1 if self.gdr.get('gdr_url_instagram') else 0,
-                1 if self.gdr.get('gdr_url_facebook') else 0,
-                1 if self.gdr.get('gdr_website') else 0,
-                1 if self.gdr.get('gdr_cse_results') else 0
-            ])
-            confidence_factors.append(min(sources_count / 5, 1.0))
+            sources_count = sum(map(bool, map(self.gdr.get, _CONFIDENCE_SOURCE_FIELDS)))
+            confidence_factors.append(min(sources_count / len(_CONFIDENCE_SOURCE_FIELDS), 1.0))
             
             # Fator 2: Qualidade do consenso
             if self.gdr.get('gdr_agreement_score'):
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""Testes do APIManager"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("dotenv")
+aiohttp = pytest.importorskip("aiohttp")
+yarl = pytest.importorskip("yarl")
+
+from src.core import api_manager
+from src.core.api_manager import APIManager, RateLimiter, ResponseCache, TransientAPIError
+
+
+class FakeClock:
+    """Relógio monotônico controlado pelo teste; sleep avança o relógio e registra a espera"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(api_manager, 'time', SimpleNamespace(monotonic=fake.monotonic))
+    monkeypatch.setattr(api_manager.asyncio, 'sleep', fake.sleep)
+    return fake
+
+
+def _response_error(status, headers=None):
+    url = yarl.URL('https://example.com/')
+    request_info = aiohttp.RequestInfo(url, 'GET', {}, url)
+    return aiohttp.ClientResponseError(request_info, (), status=status, headers=headers or {})
+
+
+# === RateLimiter ===
+
+def test_rate_limiter_allows_burst_up_to_capacity(clock):
+    limiter = RateLimiter(60)
+
+    async def consume():
+        for _ in range(60):
+            await limiter.wait_if_needed()
+
+    asyncio.run(consume())
+
+    assert clock.sleeps == []
+    assert limiter.current_calls == 60
+
+
+def test_rate_limiter_waits_only_for_one_token(clock):
+    limiter = RateLimiter(60)  # 1 token por segundo
+    limiter.tokens = 0.25
+
+    asyncio.run(limiter.wait_if_needed())
+
+    assert clock.sleeps == [pytest.approx(0.75)]
+    assert limiter.tokens == pytest.approx(0.0)
+
+
+def test_rate_limiter_refills_over_time_without_exceeding_capacity(clock):
+    limiter = RateLimiter(60)
+    limiter.tokens = 0.0
+
+    clock.now += 30
+    assert limiter.current_calls == 30
+
+    clock.now += 3600
+    assert limiter.current_calls == 0
+    asyncio.run(limiter.wait_if_needed())
+    assert limiter.tokens == pytest.approx(59.0)
+
+
+# === ResponseCache ===
+
+def test_response_cache_fresh_stale_and_miss(clock):
+    cache = ResponseCache(ttl=10, stale_ttl=100)
+    key = ResponseCache.make_key('google_maps', {'query': 'padaria'})
+
+    assert cache.get(key) == (None, False)
+
+    cache.set(key, {'results': [1]})
+    clock.now += 5
+    assert cache.get(key) == ({'results': [1]}, True)
+
+    clock.now += 50
+    assert cache.get(key) == ({'results': [1]}, False)
+
+    clock.now += 50
+    assert cache.get(key) == (None, False)
+    assert key not in cache._entries
+
+
+def test_response_cache_returns_copies(clock):
+    cache = ResponseCache()
+    cache.set('k', {'results': [1]})
+
+    value, _ = cache.get('k')
+    value['results'].append(2)
+
+    assert cache.get('k') == ({'results': [1]}, True)
+
+
+def test_response_cache_key_ignores_param_order():
+    assert (ResponseCache.make_key('google_cse', {'q': 'a', 'num': 10})
+            == ResponseCache.make_key('google_cse', {'num': 10, 'q': 'a'}))
+
+
+def test_cached_call_serves_stale_value_and_revalidates(clock):
+    manager = APIManager()
+    manager.response_cache = ResponseCache(ttl=10, stale_ttl=100)
+    calls = []
+
+    async def fetch():
+        calls.append(len(calls))
+        return {'version': len(calls)}
+
+    async def scenario():
+        first = await manager._cached_call('google_maps', {'q': 'x'}, fetch)
+        fresh = await manager._cached_call('google_maps', {'q': 'x'}, fetch)
+        clock.now += 20
+        stale = await manager._cached_call('google_maps', {'q': 'x'}, fetch)
+        await asyncio.gather(*manager._refresh_tasks.values())
+        refreshed = await manager._cached_call('google_maps', {'q': 'x'}, fetch)
+        return first, fresh, stale, refreshed
+
+    first, fresh, stale, refreshed = asyncio.run(scenario())
+
+    assert first == fresh == stale == {'version': 1}
+    assert refreshed == {'version': 2}
+    assert len(calls) == 2
+
+
+# === _with_retry ===
+
+def test_with_retry_honours_retry_after_on_429(clock):
+    manager = APIManager()
+    attempts = []
+
+    async def request():
+        attempts.append(clock.now)
+        if len(attempts) == 1:
+            raise _response_error(429, {'Retry-After': '7'})
+        return 'ok'
+
+    assert asyncio.run(manager._with_retry(request)) == 'ok'
+    assert clock.sleeps == [7.0]
+    assert len(attempts) == 2
+
+
+def test_with_retry_does_not_retry_client_errors(clock):
+    manager = APIManager()
+    attempts = []
+
+    async def request():
+        attempts.append(1)
+        raise _response_error(404)
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(manager._with_retry(request))
+    assert len(attempts) == 1
+    assert clock.sleeps == []
+
+
+def test_with_retry_raises_after_last_attempt(clock):
+    manager = APIManager()
+    manager.retry_attempts = 3
+    manager.retry_delay = 1
+    attempts = []
+
+    async def request():
+        attempts.append(1)
+        raise _response_error(503)
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(manager._with_retry(request))
+    assert len(attempts) == 3
+    assert len(clock.sleeps) == 2
+    assert all(0 <= delay <= 1 * 2 ** i for i, delay in enumerate(clock.sleeps))
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self.body
+
+
+class FakeSession:
+    def __init__(self, bodies):
+        self.bodies = list(bodies)
+        self.requests = []
+
+    def get(self, url, params=None):
+        self.requests.append((url, params))
+        return FakeResponse(self.bodies.pop(0))
+
+
+def _maps_manager(monkeypatch, bodies):
+    monkeypatch.setattr(api_manager, '_load_api_keys', lambda: {'GOOGLE_MAPS_API_KEY': 'test-key'})
+    manager = APIManager()
+    manager.session = FakeSession(bodies)
+    manager.rate_limiters['google_maps'] = RateLimiter(600)
+    manager.semaphores['google_maps'] = asyncio.Semaphore(5)
+    return manager
+
+
+def test_with_retry_retries_places_over_query_limit(clock, monkeypatch):
+    manager = _maps_manager(monkeypatch, [
+        b'{"status": "OVER_QUERY_LIMIT", "results": []}',
+        b'{"status": "OK", "results": [{"place_id": "abc"}]}',
+    ])
+
+    data = asyncio.run(manager._with_retry(
+        lambda: manager._fetch_google_maps('textsearch', {'query': 'padaria'})
+    ))
+
+    assert data['results'] == [{'place_id': 'abc'}]
+    assert len(manager.session.requests) == 2
+    assert len(clock.sleeps) == 1
+
+
+def test_places_request_denied_is_not_retried(clock, monkeypatch):
+    manager = _maps_manager(monkeypatch, [b'{"status": "REQUEST_DENIED", "results": []}'])
+
+    with pytest.raises(RuntimeError) as excinfo:
+        asyncio.run(manager._with_retry(
+            lambda: manager._fetch_google_maps('textsearch', {'query': 'padaria'})
+        ))
+
+    assert not isinstance(excinfo.value, TransientAPIError)
+    assert len(manager.session.requests) == 1
+    assert clock.sleeps == []
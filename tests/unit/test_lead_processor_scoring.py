@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Testes do score básico vetorizado do LeadProcessor"""
+import numpy as np
+import pandas as pd
+
+from src.core.lead_processor import LeadProcessor
+
+
+def _score_per_lead(row):
+    processor = LeadProcessor.__new__(LeadProcessor)
+    processor.gdr = dict(row)
+    processor._calculate_basic_score()
+    return processor.gdr['gdr_score'], processor.gdr['gdr_score_categoria']
+
+
+def test_batch_matches_per_lead_scores_for_empty_like_values():
+    df = pd.DataFrame({
+        'gdr_rating_google': [4.6, 4.0, 3.5, np.nan, 0, 5.0],
+        'gdr_total_reviews_google': [101, 51, 11, 10, np.nan, 0],
+        'gdr_telefone_1': ['11999999999', '', np.nan, 0, False, '1'],
+        'gdr_whatsapp': [True, False, 0, '', np.nan, 'sim'],
+        'gdr_website': ['', 'https://loja.com.br', np.nan, 0, None, False],
+    })
+    
+    batch = LeadProcessor.calculate_basic_scores_batch(df)
+    
+    expected = [_score_per_lead(row) for row in df.to_dict('records')]
+    assert list(zip(batch['gdr_score'], batch['gdr_score_categoria'])) == expected
+
+
+def test_batch_treats_missing_columns_as_empty():
+    batch = LeadProcessor.calculate_basic_scores_batch(pd.DataFrame({'gdr_nome': ['Loja']}))
+    
+    assert batch['gdr_score'].tolist() == [50]
+    assert batch['gdr_score_categoria'].tolist() == ['Regular']
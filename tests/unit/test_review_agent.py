@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Tests for the comprehensive review agent"""
+import asyncio
+
+import pandas as pd
+
+from src.agents.review_agent import ComprehensiveReviewAgent
+
+
+def _issue_count(package):
+    return len(package['review_report']['quality_analysis']['issues'])
+
+
+def test_review_cache_sees_in_place_edits():
+    df = pd.DataFrame({
+        'gdr_nome': ['Padaria Central', 'test company'],
+        'gdr_email_1': ['contato@padaria.com.br', 'test@test.com'],
+    })
+    agent = ComprehensiveReviewAgent()
+    
+    first = asyncio.run(agent.comprehensive_review(df))
+    df.loc[1, ['gdr_nome', 'gdr_email_1']] = ['Mercado Bom Preço', 'vendas@mercado.com.br']
+    second = asyncio.run(agent.comprehensive_review(df))
+    fresh = asyncio.run(ComprehensiveReviewAgent().comprehensive_review(df))
+    
+    assert _issue_count(first) > _issue_count(second)
+    assert _issue_count(second) == _issue_count(fresh)
+    assert df.attrs == {}
+
+
+def test_review_accepts_list_valued_columns():
+    df = pd.DataFrame({
+        'gdr_nome': ['Padaria Central', 'Mercado Bom Preço', 'Padaria Central'],
+        'gdr_categorias': [['padaria', 'café'], ['mercado'], ['padaria']],
+        'gdr_cidade': ['Porto Alegre', 'Porto Alegre', 'Porto Alegre'],
+    })
+    
+    package = asyncio.run(ComprehensiveReviewAgent().comprehensive_review(df))
+    
+    assert package['review_report']['quality_analysis']['metrics']['total_records'] == 3